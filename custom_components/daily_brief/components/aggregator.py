@@ -3,15 +3,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
 
-from ..const import MAX_CONCURRENT_FETCHES
-from ..feeds import Deduplicator, FeedParser, get_feeds_from_packs
+from ..const import (
+    ARTICLE_CANDIDATE_LIMIT,
+    DEDUP_HISTORY_DAYS,
+    DEFAULT_PARSE_WORKERS,
+    MAX_CONCURRENT_FETCHES,
+)
+from ..feeds import (
+    Deduplicator,
+    FeedParser,
+    FetchScheduler,
+    create_feed_session,
+    get_feeds_from_packs,
+)
 from ..storage import ContentSource, Database
-from ..storage.models import Article
+from ..storage.models import Article, ArticleDigest
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,27 +32,68 @@ _LOGGER = logging.getLogger(__name__)
 class ContentAggregator:
     """Aggregate content from multiple sources."""
 
-    def __init__(self, database: Database) -> None:
+    def __init__(
+        self, database: Database, parse_workers: int = DEFAULT_PARSE_WORKERS
+    ) -> None:
         """Initialize aggregator.
 
         Args:
             database: Database instance
+            parse_workers: Number of worker processes for feed parsing,
+                0 to parse in the event loop's default executor
 
         """
         self.database = database
-        self.parser = FeedParser()
         self.deduplicator = Deduplicator()
+        self.scheduler = FetchScheduler()
+        self._session: aiohttp.ClientSession | None = None
+        self._parse_workers = parse_workers
+        self._parse_executor: ProcessPoolExecutor | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared feed session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = create_feed_session()
+
+        return self._session
+
+    def _get_parse_executor(self) -> ProcessPoolExecutor | None:
+        """Get the feed parsing process pool, creating it on first use."""
+        if self._parse_workers <= 0:
+            return None
+
+        if self._parse_executor is None:
+            # Forking Home Assistant's multi-threaded process can deadlock
+            self._parse_executor = ProcessPoolExecutor(
+                max_workers=self._parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _LOGGER.debug("Started %d feed parsing workers", self._parse_workers)
+
+        return self._parse_executor
+
+    async def async_close(self) -> None:
+        """Close the feed session and release the feed parsing workers."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False, cancel_futures=True)
+            self._parse_executor = None
 
     async def fetch_all_sources(
         self,
         content_packs: list[str] | None = None,
         custom_feeds: list[dict[str, Any]] | None = None,
+        force_refresh: bool = False,
     ) -> list[Article]:
-        """Fetch articles from all enabled sources.
+        """Fetch articles from all enabled sources that are due.
 
         Args:
             content_packs: List of content pack IDs to use
             custom_feeds: List of custom feed dictionaries
+            force_refresh: Fetch every source, even if not due yet
 
         Returns:
             List of unique Article objects
@@ -62,6 +116,7 @@ class ContentAggregator:
                         language=feed["language"],
                         weight=feed.get("weight", 1.0),
                         enabled=True,
+                        pack_id=feed["pack_id"],
                     )
                 )
 
@@ -77,21 +132,43 @@ class ContentAggregator:
                         language=feed.get("language", "en"),
                         weight=feed.get("weight", 1.0),
                         enabled=True,
+                        pack_id="custom",
                     )
                 )
 
+        # Register configured sources so they get an ID and cache validators
+        sources = await self._register_sources(sources)
+
         # Also get sources from database
+        seen_urls = {source.url for source in sources}
         db_sources = await self.database.get_sources(enabled_only=True)
-        sources.extend(db_sources)
+        sources.extend(source for source in db_sources if source.url not in seen_urls)
 
         if not sources:
             _LOGGER.warning("No content sources configured")
             return []
 
+        # Skip sources whose next scheduled fetch has not come yet
+        if not force_refresh:
+            now = datetime.now()
+            due_sources = [source for source in sources if self.scheduler.is_due(source, now)]
+            _LOGGER.debug(
+                "%d of %d sources are due for fetching", len(due_sources), len(sources)
+            )
+            sources = due_sources
+
+            if not sources:
+                _LOGGER.info("No sources due for fetching")
+                return []
+
         _LOGGER.info("Fetching from %d sources", len(sources))
 
-        # Fetch articles from all sources in parallel
-        all_articles = await self._fetch_parallel(sources)
+        # Fetch articles from all sources in parallel; their fetch state is
+        # updated in memory and saved in one transaction afterwards
+        try:
+            all_articles = await self._fetch_parallel(sources)
+        finally:
+            await self._save_source_states(sources)
 
         _LOGGER.info("Fetched %d total articles", len(all_articles))
 
@@ -100,11 +177,54 @@ class ContentAggregator:
 
         _LOGGER.info("After deduplication: %d unique articles", len(unique_articles))
 
+        # Drop stories already stored by an earlier run
+        history = await self.database.get_recent_fingerprints(DEDUP_HISTORY_DAYS)
+        unique_articles = self.deduplicator.filter_seen(unique_articles, history)
+
+        _LOGGER.info("After cross-run deduplication: %d new articles", len(unique_articles))
+
         # Save articles to database
         await self._save_articles(unique_articles)
 
         return unique_articles
 
+    async def _register_sources(
+        self, sources: list[ContentSource]
+    ) -> list[ContentSource]:
+        """Attach the stored IDs and validators to configured sources.
+
+        Args:
+            sources: Sources from content packs and custom feed config
+
+        Returns:
+            Sources with the configured settings and stored state
+
+        """
+        stored_sources = await self.database.get_or_create_sources(sources)
+
+        for source, stored in zip(sources, stored_sources):
+            source.id = stored.id
+            source.etag = stored.etag
+            source.last_modified = stored.last_modified
+            source.last_fetched = stored.last_fetched
+            source.error_count = stored.error_count
+            source.update_interval = stored.update_interval
+            source.next_fetch = stored.next_fetch
+
+        return sources
+
+    async def _save_source_states(self, sources: list[ContentSource]) -> None:
+        """Save the fetch state of sources after a run.
+
+        Args:
+            sources: Sources that were fetched
+
+        """
+        try:
+            await self.database.save_source_states(sources)
+        except Exception as err:
+            _LOGGER.error("Error saving state of %d sources: %s", len(sources), err)
+
     async def _fetch_parallel(self, sources: list[ContentSource]) -> list[Article]:
         """Fetch articles from multiple sources in parallel.
 
@@ -115,28 +235,27 @@ class ContentAggregator:
             Combined list of all articles
 
         """
-        async with aiohttp.ClientSession() as session:
-            parser = FeedParser(session)
+        parser = FeedParser(self._get_session(), executor=self._get_parse_executor())
 
-            # Create tasks with semaphore to limit concurrency
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        # Create tasks with semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
 
-            async def fetch_with_semaphore(source: ContentSource) -> list[Article]:
-                async with semaphore:
-                    return await self._fetch_source(parser, source)
+        async def fetch_with_semaphore(source: ContentSource) -> list[Article]:
+            async with semaphore:
+                return await self._fetch_source(parser, source)
 
-            tasks = [fetch_with_semaphore(source) for source in sources]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [fetch_with_semaphore(source) for source in sources]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Flatten results and filter out errors
-            all_articles: list[Article] = []
-            for result in results:
-                if isinstance(result, list):
-                    all_articles.extend(result)
-                elif isinstance(result, Exception):
-                    _LOGGER.error("Error fetching source: %s", result)
+        # Flatten results and filter out errors
+        all_articles: list[Article] = []
+        for result in results:
+            if isinstance(result, list):
+                all_articles.extend(result)
+            elif isinstance(result, Exception):
+                _LOGGER.error("Error fetching source: %s", result)
 
-            return all_articles
+        return all_articles
 
     async def _fetch_source(
         self, parser: FeedParser, source: ContentSource
@@ -154,21 +273,51 @@ class ContentAggregator:
         try:
             _LOGGER.debug("Fetching source: %s (%s)", source.name, source.url)
 
-            # Fetch and parse feed
-            articles = await parser.fetch_feed(source.url, source.id)
+            # Fetch and parse feed, unless unchanged since the last fetch
+            known_ids = await self.database.get_article_ids(source.id) if source.id else set()
+            result = await parser.fetch_feed_conditional(
+                source.url,
+                source.id,
+                etag=source.etag,
+                last_modified=source.last_modified,
+                known_ids=known_ids,
+            )
+
+            if result.status == 200:
+                # Learn the cadence from every item in the feed, including
+                # the already stored ones the parser skipped
+                published = [a.published_at for a in result.articles if a.published_at]
+                published += result.known_published
+                self.scheduler.record_success(
+                    source,
+                    published,
+                    changed=bool(result.articles or result.known_published),
+                )
+            elif result.not_modified:
+                self.scheduler.record_success(source, [], changed=False)
+            else:
+                self.scheduler.record_failure(source)
+
+            # Unchanged feeds add nothing; their articles are already in the pool
+            articles = result.articles
+            if result.not_modified:
+                _LOGGER.debug("Source %s not modified", source.name)
 
             # Apply source weight to articles
             for article in articles:
                 article.score = source.weight
 
-            # Update source fetch time in database
-            if source.id:
-                await self.database.update_source_fetch_time(source.id)
+            # Update source fetch time and validators, saved after the run
+            source.last_fetched = datetime.now()
+            if result.status == 200:
+                source.etag = result.etag
+                source.last_modified = result.last_modified
 
             return articles
 
         except Exception as err:
             _LOGGER.error("Error fetching source %s: %s", source.name, err)
+            self.scheduler.record_failure(source)
             return []
 
     async def _save_articles(self, articles: list[Article]) -> None:
@@ -178,26 +327,136 @@ class ContentAggregator:
             articles: List of articles to save
 
         """
-        for article in articles:
-            try:
-                await self.database.save_article(article)
-            except Exception as err:
-                _LOGGER.error("Error saving article %s: %s", article.id, err)
+        try:
+            await self.database.save_articles_bulk(articles)
+        except Exception as err:
+            _LOGGER.error("Error saving %d articles: %s", len(articles), err)
 
     async def get_recent_articles(
-        self, limit: int | None = None, min_score: float = 0.0
+        self,
+        limit: int | None = None,
+        min_score: float = 0.0,
+        days: int | None = None,
     ) -> list[Article]:
         """Get recent articles from database.
 
         Args:
             limit: Maximum number of articles to return
             min_score: Minimum score threshold
+            days: Only return articles fetched within this many days
 
         Returns:
             List of articles
 
         """
-        return await self.database.get_articles(limit=limit, min_score=min_score)
+        since = datetime.now() - timedelta(days=days) if days is not None else None
+        return await self.database.get_articles(
+            limit=limit, min_score=min_score, since=since
+        )
+
+    async def get_recent_digests(
+        self,
+        limit: int | None = None,
+        min_score: float = 0.0,
+        days: int | None = None,
+    ) -> list[ArticleDigest]:
+        """Get digests of recent articles for selection, without their bodies.
+
+        Args:
+            limit: Maximum number of digests to return
+            min_score: Minimum score threshold
+            days: Only return articles fetched within this many days
+
+        Returns:
+            List of article digests
+
+        """
+        since = datetime.now() - timedelta(days=days) if days is not None else None
+        return await self.database.get_article_digests(
+            limit=limit, min_score=min_score, since=since
+        )
+
+    async def get_candidate_digests(
+        self,
+        interests: list[str],
+        days: int | None = None,
+        limit: int = ARTICLE_CANDIDATE_LIMIT,
+    ) -> list[ArticleDigest]:
+        """Get the digests worth scoring for a briefing.
+
+        Articles matching the interests come first, ranked by full-text
+        relevance and carrying their bm25 rank, and the rest of the pool
+        fills up to the limit by stored score. Articles about excluded topics are left out. Without the
+        full-text index the whole pool is returned.
+
+        Args:
+            interests: User interests
+            days: Only return articles fetched within this many days
+            limit: Maximum number of digests to return
+
+        Returns:
+            List of article digests
+
+        """
+        if not self.database.fts_available:
+            return await self.get_recent_digests(days=days)
+
+        since = datetime.now() - timedelta(days=days) if days is not None else None
+        candidates = await self.database.get_candidate_digests(
+            interests, since=since, limit=limit
+        )
+
+        if interests and len(candidates) < limit:
+            seen = {digest.id for digest in candidates}
+            rest = await self.database.get_candidate_digests([], since=since, limit=limit)
+            candidates += [digest for digest in rest if digest.id not in seen][
+                : limit - len(candidates)
+            ]
+
+        return candidates
+
+    async def load_articles(self, digests: list[ArticleDigest]) -> list[Article]:
+        """Load the full articles behind selected digests.
+
+        Args:
+            digests: Selected article digests
+
+        Returns:
+            Full articles in selection order, carrying the selection scores
+
+        """
+        articles = await self.database.get_articles_by_ids(
+            [digest.id for digest in digests]
+        )
+
+        scores = {digest.id: digest.score for digest in digests}
+        for article in articles:
+            article.score = scores[article.id]
+
+        return articles
+
+    async def get_source_schedule(self) -> list[dict[str, Any]]:
+        """Get the fetch schedule of all enabled sources.
+
+        Returns:
+            List of dictionaries with source name, URL, learned interval,
+            error count and next due time
+
+        """
+        sources = await self.database.get_sources(enabled_only=True, include_packs=True)
+
+        return [
+            {
+                "name": source.name,
+                "url": source.url,
+                "update_interval": source.update_interval,
+                "error_count": source.error_count,
+                "next_fetch": source.next_fetch.isoformat() if source.next_fetch else None,
+            }
+            for source in sorted(
+                sources, key=lambda s: s.next_fetch or datetime.min
+            )
+        ]
 
     async def cleanup_old_articles(self, days: int = 7) -> None:
         """Clean up articles older than specified days.
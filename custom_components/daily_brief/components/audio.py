@@ -2,8 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import math
 import os
+import subprocess
+import time
+from collections import deque
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,25 +20,181 @@ from mutagen.mp3 import MP3
 from pydub import AudioSegment
 
 from ..ai.tts import TTSProvider
-from ..const import AUDIO_FORMAT, AUDIO_SAMPLE_RATE, STORAGE_DIR
+from ..const import (
+    AUDIO_BITRATE,
+    AUDIO_FORMAT,
+    AUDIO_SAMPLE_RATE,
+    DEFAULT_TTS_CONCURRENCY,
+    MAX_RETRIES,
+    RETRY_DELAY,
+    STORAGE_DIR,
+    TTS_CACHE_DIR,
+    TTS_CACHE_MAX_BYTES,
+)
+from ..storage import DiskCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class AudioEncoder:
+    """流式MP3编码器 - 将PCM数据持续写入同一个ffmpeg进程."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        frame_rate: int,
+        channels: int = 1,
+    ) -> None:
+        """初始化编码器.
+
+        Args:
+            output_path: 输出文件路径
+            frame_rate: 输入PCM流的采样率
+            channels: 输入PCM流的声道数
+
+        """
+        self.output_path = output_path
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.frames_written = 0
+        self._process: asyncio.subprocess.Process | None = None
+        self._stderr: asyncio.Future[bytes] | None = None
+
+    @property
+    def duration(self) -> float:
+        """已写入音频的时长（秒）."""
+        return self.frames_written / self.frame_rate
+
+    async def start(self) -> None:
+        """启动ffmpeg编码进程."""
+        command = [
+            AudioSegment.converter,
+            "-hide_banner",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(self.frame_rate),
+            "-ac",
+            str(self.channels),
+            "-i",
+            "pipe:0",
+            "-ar",
+            str(AUDIO_SAMPLE_RATE),
+            "-b:a",
+            AUDIO_BITRATE,
+            "-f",
+            AUDIO_FORMAT,
+            "-y",
+            str(self.output_path),
+        ]
+
+        self._process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # 持续读取错误输出，避免管道写满阻塞ffmpeg
+        self._stderr = asyncio.ensure_future(self._process.stderr.read())
+
+    async def write(self, segment: AudioSegment) -> None:
+        """写入一个音频片段.
+
+        格式与PCM流不同的片段（如开场音乐）会先被转换。
+
+        Args:
+            segment: 音频片段
+
+        """
+        if (
+            segment.frame_rate != self.frame_rate
+            or segment.channels != self.channels
+            or segment.sample_width != 2
+        ):
+            segment = await asyncio.get_running_loop().run_in_executor(
+                None, self._conform, segment
+            )
+
+        try:
+            self._process.stdin.write(segment.raw_data)
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as err:
+            # ffmpeg提前退出，报告其错误输出
+            raise await self._error() from err
+
+        self.frames_written += len(segment.raw_data) // segment.frame_width
+
+    def _conform(self, segment: AudioSegment) -> AudioSegment:
+        """将片段转换为PCM流的格式."""
+        return (
+            segment.set_frame_rate(self.frame_rate)
+            .set_channels(self.channels)
+            .set_sample_width(2)
+        )
+
+    async def finish(self) -> None:
+        """结束输入并等待编码完成.
+
+        Raises:
+            RuntimeError: ffmpeg编码失败
+
+        """
+        self._process.stdin.close()
+        try:
+            await self._process.stdin.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+        if await self._process.wait() != 0:
+            raise await self._error()
+
+    async def _error(self) -> RuntimeError:
+        """等待ffmpeg退出并根据其错误输出生成异常."""
+        returncode = await self._process.wait()
+        stderr = await self._stderr
+        return RuntimeError(
+            f"ffmpeg编码失败 (返回码 {returncode}): "
+            f"{stderr.decode(errors='ignore').strip()}"
+        )
+
+    async def abort(self) -> None:
+        """终止编码进程."""
+        if self._process is None or self._process.returncode is not None:
+            return
+
+        self._process.kill()
+        await self._process.wait()
+        if self._stderr is not None:
+            self._stderr.cancel()
+
+
 class AudioProcessor:
     """音频生成和处理器."""
 
-    def __init__(self, tts_provider: TTSProvider, storage_path: Path) -> None:
+    def __init__(
+        self,
+        tts_provider: TTSProvider,
+        storage_path: Path,
+        concurrency: int = DEFAULT_TTS_CONCURRENCY,
+    ) -> None:
         """初始化音频处理器.
 
         Args:
             tts_provider: TTS提供商实例
             storage_path: 存储路径
+            concurrency: 同时合成的音频片段数量上限
 
         """
         self.tts_provider = tts_provider
+        self.concurrency = max(1, concurrency)
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.segment_cache = DiskCache(
+            storage_path / TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES, suffix=".mp3"
+        )
 
     async def generate_briefing_audio(
         self,
@@ -57,55 +219,47 @@ class AudioProcessor:
 
         try:
             # 处理暂停标签
-            audio_segments = []
             script_parts = script.split("<pause>")
+            parts = [
+                (idx, part.strip())
+                for idx, part in enumerate(script_parts)
+                if part.strip()
+            ]
+
+            # 并发生成各片段，结果保持脚本顺序
+            started = time.monotonic()
+            results = await self._synthesize_segments(
+                [part for _, part in parts],
+                voice=kwargs.get("voice"),
+                speed=kwargs.get("speed", 1.0),
+            )
+            tts_seconds = time.monotonic() - started
+            _LOGGER.info(
+                "TTS完成: %d 个片段 (缓存 %d), 耗时 %.1f 秒 (请求累计 %.1f 秒, 并发 %d)",
+                len(parts),
+                sum(1 for _, elapsed in results if elapsed is None),
+                tts_seconds,
+                sum(elapsed for _, elapsed in results if elapsed is not None),
+                self.concurrency,
+            )
 
-            for idx, part in enumerate(script_parts):
-                part = part.strip()
-                if not part:
-                    continue
-
-                _LOGGER.debug("生成音频片段 %d/%d", idx + 1, len(script_parts))
-
-                # 使用TTS生成音频
-                audio_bytes = await self.tts_provider.generate_audio(
-                    part,
-                    voice=kwargs.get("voice"),
-                    speed=kwargs.get("speed", 1.0),
-                )
-
-                # 将字节转换为AudioSegment
-                audio_segment = self._bytes_to_audio_segment(audio_bytes)
-                audio_segments.append(audio_segment)
-
-                # 在片段之间添加暂停（除了最后一个）
-                if idx < len(script_parts) - 1:
-                    pause_duration = kwargs.get("pause_duration", 1000)  # 毫秒
-                    silence = AudioSegment.silent(duration=pause_duration)
-                    audio_segments.append(silence)
-
-            # 合并所有音频片段
-            if not audio_segments:
+            if not parts:
                 raise ValueError("没有生成任何音频片段")
 
-            combined_audio = audio_segments[0]
-            for segment in audio_segments[1:]:
-                combined_audio += segment
-
-            # 音频后处理
-            processed_audio = self._post_process_audio(combined_audio, **kwargs)
-
             # 生成文件名和路径
             filename = f"{date}_{briefing_type}.{AUDIO_FORMAT}"
             audio_path = self.storage_path / filename
 
-            # 导出为MP3
-            processed_audio.export(
-                str(audio_path),
-                format=AUDIO_FORMAT,
-                bitrate="128k",
-                parameters=["-ar", str(AUDIO_SAMPLE_RATE)],
+            # 流式渲染为MP3
+            started = time.monotonic()
+            duration = await self._render(
+                [audio_bytes for audio_bytes, _ in results],
+                # 在片段之间添加暂停（除了最后一个）
+                [idx < len(script_parts) - 1 for idx, _ in parts],
+                audio_path,
+                **kwargs,
             )
+            _LOGGER.info("音频渲染完成, 耗时 %.1f 秒", time.monotonic() - started)
 
             # 添加元数据
             self._add_metadata(
@@ -116,7 +270,7 @@ class AudioProcessor:
                 date=date,
             )
 
-            duration_seconds = int(len(processed_audio) / 1000)
+            duration_seconds = int(duration)
 
             _LOGGER.info(
                 "音频生成完成: %s (时长: %d秒, 大小: %d KB)",
@@ -131,88 +285,323 @@ class AudioProcessor:
             _LOGGER.error("生成音频时出错: %s", err)
             raise
 
-    def _bytes_to_audio_segment(self, audio_bytes: bytes) -> AudioSegment:
-        """将音频字节转换为AudioSegment.
+    async def _synthesize_segments(
+        self, parts: list[str], voice: str | None = None, speed: float = 1.0
+    ) -> list[tuple[bytes, float | None]]:
+        """并发合成多个文本片段.
+
+        先查询片段缓存，未命中的片段才调用TTS提供商，并写回缓存。
+        同时进行的请求数量受 concurrency 限制，返回结果与输入顺序一致。
+        任一片段重试后仍失败时，取消其余片段并抛出异常。
 
         Args:
-            audio_bytes: 音频字节数据
+            parts: 文本片段列表
+            voice: 语音
+            speed: 语速
 
         Returns:
-            AudioSegment对象
+            (音频字节, 请求耗时秒数) 列表，缓存命中时耗时为None
 
         """
-        # 创建临时文件
-        import tempfile
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        provider = self.tts_provider
+        model = f"{type(provider).__name__}:{getattr(provider, 'model', '')}"
+
+        async def synthesize(idx: int, text: str) -> tuple[bytes, float | None]:
+            cache_key = (
+                text,
+                voice or getattr(provider, "default_voice", None),
+                speed,
+                model,
+            )
+            cached = await loop.run_in_executor(
+                None, lambda: self.segment_cache.get(*cache_key)
+            )
+            if cached is not None:
+                _LOGGER.debug("音频片段 %d/%d 命中缓存", idx + 1, len(parts))
+                return cached, None
+
+            async with semaphore:
+                _LOGGER.debug("生成音频片段 %d/%d", idx + 1, len(parts))
+                audio_bytes, elapsed = await self._synthesize_with_retry(
+                    text, voice=voice, speed=speed
+                )
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
+            await loop.run_in_executor(
+                None, lambda: self.segment_cache.set(*cache_key, value=audio_bytes)
+            )
+            return audio_bytes, elapsed
 
+        tasks = [
+            asyncio.ensure_future(synthesize(idx, text))
+            for idx, text in enumerate(parts)
+        ]
         try:
-            # 从临时文件加载
-            audio_segment = AudioSegment.from_mp3(tmp_path)
-            return audio_segment
-        finally:
-            # 清理临时文件
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _synthesize_with_retry(
+        self, text: str, **kwargs: Any
+    ) -> tuple[bytes, float]:
+        """合成单个片段，失败时按指数退避重试.
+
+        Args:
+            text: 文本片段
+            **kwargs: 传给TTS提供商的参数
+
+        Returns:
+            (音频字节, 请求耗时秒数)
+
+        """
+        attempt = 1
+        while True:
+            started = time.monotonic()
             try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
+                audio_bytes = await self.tts_provider.generate_audio(text, **kwargs)
+                return audio_bytes, time.monotonic() - started
+            except Exception as err:
+                if attempt >= MAX_RETRIES:
+                    raise
+                delay = RETRY_DELAY * 2 ** (attempt - 1)
+                _LOGGER.warning(
+                    "音频片段生成失败 (第 %d/%d 次): %s，%d 秒后重试",
+                    attempt,
+                    MAX_RETRIES,
+                    err,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
 
-    def _post_process_audio(
-        self, audio: AudioSegment, **kwargs: Any
-    ) -> AudioSegment:
-        """音频后处理.
+    async def _render(
+        self,
+        chunks: list[bytes],
+        pauses: list[bool],
+        audio_path: Path,
+        **kwargs: Any,
+    ) -> float:
+        """流式渲染音频文件.
+
+        片段按顺序解码后立即写入同一个ffmpeg编码进程完成重采样和MP3编码，
+        内存中只保留少量已解码片段，峰值内存与简报时长无关。
+        标准化音量时先扫描一遍各片段的响度，整段语音使用同一个增益。
+        先写入临时文件，完成后再替换目标文件。
 
         Args:
-            audio: 原始音频
+            chunks: 各片段的MP3字节，按脚本顺序
+            pauses: 各片段之后是否添加暂停
+            audio_path: 输出文件路径
             **kwargs: 处理参数
 
         Returns:
-            处理后的音频
+            音频时长秒数
 
         """
-        processed = audio
-
-        # 音量标准化
+        loop = asyncio.get_running_loop()
+        speed = kwargs.get("playback_speed", 1.0)
+        intro = await loop.run_in_executor(
+            None, self._load_intro_music, kwargs.get("intro_music_path")
+        )
+        outro = await loop.run_in_executor(
+            None, self._load_outro_music, kwargs.get("outro_music_path")
+        )
+
+        pause_duration = kwargs.get("pause_duration", 1000)  # 毫秒
+        gain = 0.0
         if kwargs.get("normalize_volume", True):
-            processed = self._normalize_volume(processed)
+            gain = await self._loudness_gain(chunks, pauses, pause_duration)
 
-        # 速度调整
-        speed = kwargs.get("playback_speed", 1.0)
-        if speed != 1.0:
-            processed = self._change_speed(processed, speed)
+        part_path = audio_path.with_name(audio_path.name + ".part")
+        encoder: AudioEncoder | None = None
+        silence: AudioSegment | None = None
 
-        # 添加开场音乐（如果提供）
-        intro_music_path = kwargs.get("intro_music_path")
-        if intro_music_path and Path(intro_music_path).exists():
-            processed = self._add_intro_music(processed, intro_music_path)
+        try:
+            idx = 0
+            async with contextlib.aclosing(
+                self._iter_decoded(chunks, speed, gain)
+            ) as segments:
+                async for segment in segments:
+                    if encoder is None:
+                        # 以第一个片段的格式作为整个PCM流的格式
+                        encoder = AudioEncoder(
+                            part_path,
+                            frame_rate=segment.frame_rate,
+                            channels=segment.channels,
+                        )
+                        await encoder.start()
+
+                        # 暂停和语音一起变速，与原先整体调速的效果一致
+                        silence = AudioSegment.silent(
+                            duration=pause_duration / speed,
+                            frame_rate=segment.frame_rate,
+                        )
+
+                        if intro is not None:
+                            await encoder.write(intro)
+
+                    await encoder.write(segment)
+                    if pauses[idx]:
+                        await encoder.write(silence)
+                    idx += 1
+
+            if encoder is None:
+                raise ValueError("没有生成任何音频片段")
 
-        # 添加结束音乐（如果提供）
-        outro_music_path = kwargs.get("outro_music_path")
-        if outro_music_path and Path(outro_music_path).exists():
-            processed = self._add_outro_music(processed, outro_music_path)
+            if outro is not None:
+                await encoder.write(outro)
 
-        return processed
+            await encoder.finish()
+            os.replace(part_path, audio_path)
+
+        except BaseException:
+            if encoder is not None:
+                await encoder.abort()
+            part_path.unlink(missing_ok=True)
+            raise
 
-    def _normalize_volume(self, audio: AudioSegment) -> AudioSegment:
-        """标准化音量.
+        return encoder.duration
+
+    async def _iter_decoded(
+        self, chunks: list[bytes], speed: float = 1.0, gain: float = 0.0
+    ) -> AsyncIterator[AudioSegment]:
+        """按顺序解码各片段.
+
+        在线程池中提前解码最多 concurrency 个片段，
+        使解码与编码重叠，同时限制内存中的PCM数据量。
 
         Args:
-            audio: 输入音频
+            chunks: 各片段的MP3字节
+            speed: 播放速度
+            gain: 应用到每个片段的增益（dB）
+
+        Yields:
+            解码并处理后的音频片段
+
+        """
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[AudioSegment]] = deque()
+        remaining = iter(chunks)
+
+        def decode(audio_bytes: bytes) -> AudioSegment:
+            segment = self._bytes_to_audio_segment(audio_bytes)
+            if gain:
+                segment = segment.apply_gain(gain)
+            if speed != 1.0:
+                segment = self._change_speed(segment, speed)
+            return segment
+
+        try:
+            while True:
+                for audio_bytes in remaining:
+                    pending.append(loop.run_in_executor(None, decode, audio_bytes))
+                    if len(pending) > self.concurrency:
+                        break
+
+                if not pending:
+                    return
+
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _loudness_gain(
+        self, chunks: list[bytes], pauses: list[bool], pause_duration: float
+    ) -> float:
+        """计算把整段语音标准化到目标音量所需的增益.
+
+        与合并后整体标准化的结果一致：各片段解码后只统计平方和，不保留PCM，
+        片段间的暂停按静音计入样本数。
+
+        Args:
+            chunks: 各片段的MP3字节
+            pauses: 各片段之后是否添加暂停
+            pause_duration: 暂停时长（毫秒）
 
         Returns:
-            音量标准化后的音频
+            增益（dB），完全静音时为0
 
         """
         # 目标音量（dBFS）
         target_dBFS = -20.0
 
-        # 计算增益变化
-        change_in_dBFS = target_dBFS - audio.dBFS
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        def measure(audio_bytes: bytes) -> tuple[float, int]:
+            segment = self._bytes_to_audio_segment(audio_bytes)
+            samples = len(segment.raw_data) // segment.sample_width
+            return float(segment.rms) ** 2 * samples, samples
 
-        # 应用增益
-        return audio.apply_gain(change_in_dBFS)
+        async def measure_limited(audio_bytes: bytes) -> tuple[float, int]:
+            async with semaphore:
+                return await loop.run_in_executor(None, measure, audio_bytes)
+
+        results = await asyncio.gather(*(measure_limited(chunk) for chunk in chunks))
+
+        energy = sum(result[0] for result in results)
+        samples = sum(result[1] for result in results)
+        samples += sum(pauses) * int(pause_duration * AUDIO_SAMPLE_RATE / 1000)
+
+        # 完全静音的音频无法计算增益
+        if not energy:
+            return 0.0
+
+        rms = math.sqrt(energy / samples)
+        max_amplitude = float(1 << 15)
+        return target_dBFS - 20 * math.log10(rms / max_amplitude)
+
+    def _bytes_to_audio_segment(self, audio_bytes: bytes) -> AudioSegment:
+        """将音频字节转换为AudioSegment.
+
+        字节通过管道送入ffmpeg，解码为输出采样率的单声道PCM后从管道读回，
+        不经过pydub的临时文件，也不需要ffprobe探测格式。
+
+        Args:
+            audio_bytes: 音频字节数据 (MP3)
+
+        Returns:
+            AudioSegment对象
+
+        Raises:
+            RuntimeError: ffmpeg解码失败
+
+        """
+        command = [
+            AudioSegment.converter,
+            "-hide_banner",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-f",
+            "mp3",
+            "-i",
+            "pipe:0",
+            "-f",
+            "s16le",
+            "-ac",
+            "1",
+            "-ar",
+            str(AUDIO_SAMPLE_RATE),
+            "pipe:1",
+        ]
+        result = subprocess.run(command, input=audio_bytes, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg解码失败 (返回码 {result.returncode}): "
+                f"{result.stderr.decode(errors='ignore').strip()}"
+            )
+
+        return AudioSegment(
+            data=result.stdout,
+            sample_width=2,
+            frame_rate=AUDIO_SAMPLE_RATE,
+            channels=1,
+        )
 
     def _change_speed(self, audio: AudioSegment, speed: float) -> AudioSegment:
         """改变播放速度.
@@ -230,19 +619,19 @@ class AudioProcessor:
         new_frame_rate = int(audio.frame_rate * speed)
         return audio._spawn(audio.raw_data, overrides={"frame_rate": new_frame_rate})
 
-    def _add_intro_music(
-        self, audio: AudioSegment, intro_path: str
-    ) -> AudioSegment:
-        """添加开场音乐.
+    def _load_intro_music(self, intro_path: str | None) -> AudioSegment | None:
+        """加载开场音乐.
 
         Args:
-            audio: 主音频
             intro_path: 开场音乐路径
 
         Returns:
-            添加开场音乐后的音频
+            处理后的开场音乐，未配置或加载失败时为None
 
         """
+        if not intro_path or not Path(intro_path).exists():
+            return None
+
         try:
             intro = AudioSegment.from_file(intro_path)
 
@@ -257,26 +646,25 @@ class AudioProcessor:
             if len(intro) > max_intro_length:
                 intro = intro[:max_intro_length]
 
-            # 合并音频
-            return intro + audio
+            return intro
 
         except Exception as err:
             _LOGGER.warning("添加开场音乐失败: %s", err)
-            return audio
+            return None
 
-    def _add_outro_music(
-        self, audio: AudioSegment, outro_path: str
-    ) -> AudioSegment:
-        """添加结束音乐.
+    def _load_outro_music(self, outro_path: str | None) -> AudioSegment | None:
+        """加载结束音乐.
 
         Args:
-            audio: 主音频
             outro_path: 结束音乐路径
 
         Returns:
-            添加结束音乐后的音频
+            处理后的结束音乐，未配置或加载失败时为None
 
         """
+        if not outro_path or not Path(outro_path).exists():
+            return None
+
         try:
             outro = AudioSegment.from_file(outro_path)
 
@@ -291,12 +679,11 @@ class AudioProcessor:
             if len(outro) > max_outro_length:
                 outro = outro[:max_outro_length]
 
-            # 合并音频
-            return audio + outro
+            return outro
 
         except Exception as err:
             _LOGGER.warning("添加结束音乐失败: %s", err)
-            return audio
+            return None
 
     def _add_metadata(
         self,
@@ -0,0 +1,165 @@
+"""Maximal marginal relevance reranking for diverse briefings."""
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+from ..const import DIVERSITY_TITLE_WEIGHT, DIVERSITY_TOPIC_WEIGHT, DIVERSITY_TRADEOFF
+from ..storage.index import tokenize
+from ..storage.models import ArticleDigest
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy similarities are computed pair by pair
+    np = None
+
+
+def article_vector(article: ArticleDigest) -> Counter[str]:
+    """Get the sparse term/topic vector used to compare articles.
+
+    Args:
+        article: Article digest
+
+    Returns:
+        Feature weights from title and summary terms and topic tags
+
+    """
+    vector = Counter(tokenize(article.summary or ""))
+    for term in tokenize(article.title):
+        vector[term] += DIVERSITY_TITLE_WEIGHT
+    for topic in article.topics:
+        vector["#" + topic.lower()] += DIVERSITY_TOPIC_WEIGHT
+
+    return vector
+
+
+def mmr_rerank(
+    articles: Sequence[ArticleDigest],
+    count: int,
+    tradeoff: float = DIVERSITY_TRADEOFF,
+    seed_ids: Iterable[str] = (),
+) -> list[ArticleDigest]:
+    """Pick a diverse subset with maximal marginal relevance.
+
+    Each step takes the article with the best balance of its own score and
+    its distance to everything picked so far:
+    ``tradeoff * relevance - (1 - tradeoff) * max cosine similarity``.
+    Similarities are computed once, and the running maximum is updated per
+    pick, so the whole rerank is O(count * len(articles)).
+
+    Args:
+        articles: Candidates with their scores
+        count: Number of articles to pick
+        tradeoff: Weight of relevance against novelty, between 0 and 1
+        seed_ids: IDs of articles that must be picked first, in this order
+
+    Returns:
+        Picked articles in pick order
+
+    """
+    if not articles or count <= 0:
+        return []
+
+    index = {article.id: position for position, article in enumerate(articles)}
+    seeds = list(dict.fromkeys(index[seed_id] for seed_id in seed_ids if seed_id in index))
+
+    top_score = max(article.score for article in articles)
+    scale = 1 / top_score if top_score > 0 else 0.0
+    vectors = [article_vector(article) for article in articles]
+
+    if np is not None:
+        order = _mmr_vectorized(vectors, articles, scale, count, tradeoff, seeds)
+    else:
+        order = _mmr_pairwise(vectors, articles, scale, count, tradeoff, seeds)
+
+    return [articles[position] for position in order]
+
+
+def _mmr_vectorized(
+    vectors: list[Counter[str]],
+    articles: Sequence[ArticleDigest],
+    scale: float,
+    count: int,
+    tradeoff: float,
+    seeds: list[int],
+) -> list[int]:
+    """Run the MMR picks with NumPy, one similarity row per pick."""
+    vocabulary: dict[str, int] = {}
+    for vector in vectors:
+        for feature in vector:
+            vocabulary.setdefault(feature, len(vocabulary))
+
+    matrix = np.zeros((len(vectors), max(1, len(vocabulary))))
+    for row, vector in enumerate(vectors):
+        for feature, weight in vector.items():
+            matrix[row, vocabulary[feature]] = weight
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+    relevance = np.array([article.score for article in articles]) * scale
+    max_similarity = np.zeros(len(articles))
+    available = np.ones(len(articles), dtype=bool)
+    order: list[int] = []
+
+    for position in seeds[:count]:
+        order.append(position)
+        available[position] = False
+        np.maximum(max_similarity, matrix @ matrix[position], out=max_similarity)
+
+    while len(order) < count and available.any():
+        marginal = tradeoff * relevance - (1 - tradeoff) * max_similarity
+        position = int(np.argmax(np.where(available, marginal, -np.inf)))
+        order.append(position)
+        available[position] = False
+        np.maximum(max_similarity, matrix @ matrix[position], out=max_similarity)
+
+    return order
+
+
+def _mmr_pairwise(
+    vectors: list[Counter[str]],
+    articles: Sequence[ArticleDigest],
+    scale: float,
+    count: int,
+    tradeoff: float,
+    seeds: list[int],
+) -> list[int]:
+    """Run the MMR picks with plain Python, one similarity row per pick."""
+    norms = [math.sqrt(sum(w * w for w in vector.values())) for vector in vectors]
+
+    def similarities(position: int) -> list[float]:
+        source, source_norm = vectors[position], norms[position]
+        return [
+            sum(weight * other.get(feature, 0) for feature, weight in source.items())
+            / (source_norm * other_norm)
+            if source_norm and other_norm
+            else 0.0
+            for other, other_norm in zip(vectors, norms)
+        ]
+
+    relevance = [article.score * scale for article in articles]
+    max_similarity = [0.0] * len(articles)
+    available = set(range(len(articles)))
+    order: list[int] = []
+
+    def pick(position: int) -> None:
+        order.append(position)
+        available.discard(position)
+        for other, value in enumerate(similarities(position)):
+            if value > max_similarity[other]:
+                max_similarity[other] = value
+
+    for position in seeds[:count]:
+        pick(position)
+
+    while len(order) < count and available:
+        pick(
+            max(
+                sorted(available),
+                key=lambda i: tradeoff * relevance[i] - (1 - tradeoff) * max_similarity[i],
+            )
+        )
+
+    return order
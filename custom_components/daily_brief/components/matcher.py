@@ -0,0 +1,110 @@
+"""Multi-pattern interest matching for relevance scoring."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+from ..storage.index import tokenize
+
+
+class InterestMatcher:
+    """Find which interests occur in a text in a single pass.
+
+    An Aho-Corasick automaton over word tokens: every interest is split into
+    tokens and all of them are matched at once while walking the tokens of
+    the text. Working on tokens makes matches respect word boundaries, so
+    "ai" does not match "said", while CJK interests still match anywhere
+    because every CJK character is a token of its own. Overlapping interests
+    such as "machine learning" and "learning" are all reported.
+    """
+
+    def __init__(self, interests: Iterable[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            interests: Interests to match; duplicates are kept as separate entries
+
+        """
+        self.interests = list(interests)
+
+        # State 0 is the root; a state's outputs are the interests ending there
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        for index, interest in enumerate(self.interests):
+            tokens = tokenize(interest)
+            if not tokens:
+                continue
+
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = next_state
+            self._outputs[state] += (index,)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        """Link every state to its longest proper suffix in the trie."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+
+                # Suffix states are shallower, so their outputs are complete
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def __bool__(self) -> bool:
+        """Return True if there is at least one interest to match."""
+        return len(self._goto) > 1
+
+    def find(self, text: str) -> set[int]:
+        """Find the interests that occur in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Indices into ``interests`` of every interest found
+
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found: set[int] = set()
+        state = 0
+
+        for token in tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+
+        return found
+
+    def count(self, text: str) -> int:
+        """Count the interests that occur in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Number of interest entries found
+
+        """
+        return len(self.find(text))
@@ -1,6 +1,7 @@
 """简报生成编排器 - 协调整个生成流程."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -10,8 +11,13 @@ from homeassistant.core import HomeAssistant
 
 from ..ai.providers.openai import OpenAILLMProvider, OpenAITTSProvider
 from ..const import (
+    ARTICLE_POOL_DAYS,
     BRIEFING_CONFIGS,
+    CONF_PARSE_WORKERS,
+    CONF_TTS_CONCURRENCY,
     DEFAULT_ARTICLE_COUNT,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_TTS_CONCURRENCY,
     STATUS_ERROR,
     STATUS_FETCHING,
     STATUS_GENERATING,
@@ -55,15 +61,23 @@ class BriefingOrchestrator:
         self.tts_provider = self._create_tts_provider()
 
         # 初始化组件
-        self.aggregator = ContentAggregator(database)
+        self.aggregator = ContentAggregator(
+            database,
+            parse_workers=self.config.get(CONF_PARSE_WORKERS, DEFAULT_PARSE_WORKERS),
+        )
         self.selector = ArticleSelector(self.llm_provider)
         self.generator = ScriptGenerator(self.llm_provider)
 
         storage_path = Path(hass.config.path(STORAGE_DIR))
-        self.audio_processor = AudioProcessor(self.tts_provider, storage_path)
+        self.audio_processor = AudioProcessor(
+            self.tts_provider,
+            storage_path,
+            concurrency=self.config.get(CONF_TTS_CONCURRENCY, DEFAULT_TTS_CONCURRENCY),
+        )
         self.player = PlaybackController(hass, database)
 
         # 生成状态
+        self._ingest_lock = asyncio.Lock()
         self._is_generating = False
         self._current_progress = 0
         self._status_callback = None
@@ -154,7 +168,9 @@ class BriefingOrchestrator:
             self._update_status(STATUS_FETCHING, 0)
 
             # 步骤1: 获取内容 (0-20%)
-            articles = await self._fetch_content(force_refresh)
+            articles = await self._fetch_content(
+                force_refresh, kwargs.get("liked_topics", [])
+            )
             if not articles:
                 _LOGGER.error("未获取到任何文章")
                 self._update_status(STATUS_ERROR, 0)
@@ -212,46 +228,91 @@ class BriefingOrchestrator:
         finally:
             self._is_generating = False
 
-    async def _fetch_content(self, force_refresh: bool = False) -> list:
-        """获取内容.
+    async def async_ingest(self, force_refresh: bool = False) -> int:
+        """抓取到期的订阅源并把新文章存入数据库.
+
+        由协调器在后台定期调用，生成简报时无需等待网络抓取。
 
         Args:
-            force_refresh: 是否强制刷新
+            force_refresh: 是否忽略抓取计划，抓取所有订阅源
 
         Returns:
-            文章列表
+            新存入的文章数量
 
         """
-        _LOGGER.info("开始获取内容...")
+        async with self._ingest_lock:
+            articles = await self.aggregator.fetch_all_sources(
+                content_packs=self.config.get("content_packs", []),
+                custom_feeds=self.config.get("custom_feeds", []),
+                force_refresh=force_refresh,
+            )
+
+        _LOGGER.debug("后台抓取存入 %d 篇新文章", len(articles))
+        return len(articles)
 
-        # 获取配置的内容包和自定义源
-        content_packs = self.config.get("content_packs", [])
-        custom_feeds = self.config.get("custom_feeds", [])
+    async def _fetch_content(
+        self, force_refresh: bool = False, liked_topics: list[str] | None = None
+    ) -> list:
+        """获取内容.
+
+        默认使用后台已抓取并去重的文章池，只有强制刷新时才等待网络抓取。
+        只读取文章摘要（不含正文），正文在选择完成后按需加载。
+
+        Args:
+            force_refresh: 是否强制刷新
+            liked_topics: 以前喜欢的话题，与兴趣一起用于全文匹配
+
+        Returns:
+            候选文章摘要列表，匹配的文章带有 bm25 相关度
 
-        articles = await self.aggregator.fetch_all_sources(
-            content_packs=content_packs,
-            custom_feeds=custom_feeds,
+        """
+        if force_refresh:
+            _LOGGER.info("强制刷新，开始抓取内容...")
+            await self.async_ingest(force_refresh=True)
+
+        # 由数据库全文索引预先筛选候选文章，并排除不感兴趣的话题
+        queries = self._get_interests() + list(liked_topics or [])
+        articles = await self.aggregator.get_candidate_digests(
+            queries, days=ARTICLE_POOL_DAYS
         )
 
+        # 文章池为空时（例如首次运行），同步抓取一次
+        if not articles and not force_refresh:
+            _LOGGER.info("文章池为空，开始抓取内容...")
+            await self.async_ingest()
+            articles = await self.aggregator.get_candidate_digests(
+                queries, days=ARTICLE_POOL_DAYS
+            )
+
         _LOGGER.info("获取到 %d 篇文章", len(articles))
 
         return articles
 
+    def _get_interests(self) -> list[str]:
+        """获取用户兴趣列表.
+
+        Returns:
+            兴趣列表
+
+        """
+        interests = self.config.get("interests", [])
+        if isinstance(interests, str):
+            interests = [i.strip() for i in interests.split(",") if i.strip()]
+        return interests
+
     async def _select_articles(self, articles: list, **kwargs: Any) -> list:
         """选择文章.
 
         Args:
-            articles: 候选文章列表
+            articles: 候选文章摘要列表
             **kwargs: 额外参数
 
         Returns:
-            选择的文章列表
+            选择的完整文章列表
 
         """
         # 获取用户兴趣
-        interests = self.config.get("interests", [])
-        if isinstance(interests, str):
-            interests = [i.strip() for i in interests.split(",") if i.strip()]
+        interests = self._get_interests()
 
         # 确定文章数量
         briefing_length = self.config.get("briefing_length", "balanced")
@@ -267,6 +328,9 @@ class BriefingOrchestrator:
             **kwargs,
         )
 
+        # 只为最终选中的文章加载正文
+        selected = await self.aggregator.load_articles(selected)
+
         _LOGGER.info("选择了 %d 篇文章", len(selected))
 
         return selected
@@ -400,6 +464,10 @@ class BriefingOrchestrator:
         """
         return await self.player.stop_playback(media_player)
 
+    async def async_shutdown(self) -> None:
+        """释放组件占用的资源."""
+        await self.aggregator.async_close()
+
     def is_generating(self) -> bool:
         """检查是否正在生成.
 
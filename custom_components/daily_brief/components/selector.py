@@ -1,7 +1,9 @@
 """Article selection component with AI and scoring."""
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -18,10 +20,29 @@ from ..const import (
     SCORE_QUALITY_WEIGHT,
     SCORE_RELEVANCE_WEIGHT,
 )
-from ..storage.models import Article
+from ..storage.models import ArticleBatch, ArticleDigest
+from .diversity import mmr_rerank
+from .matcher import InterestMatcher
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy articles are scored one by one
+    np = None
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _score_key(article: ArticleDigest) -> float:
+    """Sort key for ranking articles by score."""
+    return article.score
+
+
+def _top_relevance(articles: list[ArticleDigest]) -> float:
+    """Get the best full-text relevance of a pool, 0 if nothing matched."""
+    return max((article.relevance for article in articles), default=0.0)
+
 
 class ArticleSelector:
     """Select and score articles for briefing."""
@@ -34,14 +55,16 @@ class ArticleSelector:
 
         """
         self.llm_provider = llm_provider
+        # Rebuilt only when the interests change
+        self._matcher: InterestMatcher | None = None
 
     async def select_articles(
         self,
-        articles: list[Article],
+        articles: list[ArticleDigest],
         count: int,
         interests: list[str] | None = None,
         **kwargs: Any,
-    ) -> list[Article]:
+    ) -> list[ArticleDigest]:
         """Select top articles for briefing.
 
         Args:
@@ -59,14 +82,14 @@ class ArticleSelector:
         if not articles:
             return []
 
-        # Step 1: Score all articles
-        scored_articles = self._score_articles(articles, interests or [])
-
-        # Step 2: Initial filter - keep top 50 or 5x target count
+        # Step 1 + 2: Score all articles and keep the top 50 or 5x target
+        # count in a bounded heap, O(n log k) instead of a full sort
         initial_count = max(50, count * 5)
-        top_candidates = sorted(scored_articles, key=lambda a: a.score, reverse=True)[
-            :initial_count
-        ]
+        top_candidates = heapq.nlargest(
+            initial_count,
+            self._iter_scored(articles, interests or []),
+            key=_score_key,
+        )
 
         _LOGGER.debug("Filtered to top %d candidates", len(top_candidates))
 
@@ -86,10 +109,38 @@ class ArticleSelector:
         _LOGGER.info("Final selection: %d articles", len(final_selection))
         return final_selection
 
+    def _iter_scored(
+        self, articles: list[ArticleDigest], interests: list[str]
+    ) -> Iterator[ArticleDigest]:
+        """Score articles, yielding each one as soon as it has its score.
+
+        With NumPy the pool is scored as one batch first; without it every
+        article is scored lazily as the consumer pulls it.
+
+        Args:
+            articles: Articles to score, updated in place
+            interests: User interests
+
+        Yields:
+            Scored articles in input order
+
+        """
+        if np is not None:
+            yield from self._score_articles(articles, interests)
+            return
+
+        now = datetime.now()
+        top_relevance = _top_relevance(articles)
+        for article in articles:
+            article.score = self._calculate_score(article, interests, now, top_relevance)
+            yield article
+
     def _score_articles(
-        self, articles: list[Article], interests: list[str]
-    ) -> list[Article]:
-        """Score all articles based on multiple factors.
+        self, articles: list[ArticleDigest], interests: list[str]
+    ) -> list[ArticleDigest]:
+        """Score all articles based on multiple factors as one NumPy batch.
+
+        Only called when NumPy is available; _iter_scored scores without it.
 
         Args:
             articles: Articles to score
@@ -99,33 +150,132 @@ class ArticleSelector:
             Articles with updated scores
 
         """
-        for article in articles:
-            importance_score = self._calculate_importance(article)
-            relevance_score = self._calculate_relevance(article, interests)
-            freshness_score = self._calculate_freshness(article)
-            quality_score = self._calculate_quality(article)
-
-            # Weighted total score (0-100)
-            article.score = (
-                importance_score * SCORE_IMPORTANCE_WEIGHT / 100
-                + relevance_score * SCORE_RELEVANCE_WEIGHT / 100
-                + freshness_score * SCORE_FRESHNESS_WEIGHT / 100
-                + quality_score * SCORE_QUALITY_WEIGHT / 100
-            )
+        # One reference time and best full-text rank for the whole pool
+        self._score_batch(articles, interests, datetime.now(), _top_relevance(articles))
 
-            _LOGGER.debug(
-                "Scored article '%s': %.1f (I:%.1f R:%.1f F:%.1f Q:%.1f)",
-                article.title[:50],
-                article.score,
-                importance_score,
-                relevance_score,
-                freshness_score,
-                quality_score,
-            )
+        _LOGGER.debug("Scored %d articles", len(articles))
 
         return articles
 
-    def _calculate_importance(self, article: Article) -> float:
+    def _calculate_score(
+        self,
+        article: ArticleDigest,
+        interests: list[str],
+        now: datetime,
+        top_relevance: float = 0.0,
+    ) -> float:
+        """Calculate the weighted total score of one article (0-100).
+
+        Args:
+            article: Article to score
+            interests: User interests
+            now: Reference time for freshness
+            top_relevance: Best full-text relevance in the pool
+
+        Returns:
+            Total score
+
+        """
+        importance_score = self._calculate_importance(article)
+        relevance_score = self._calculate_relevance(article, interests, top_relevance)
+        freshness_score = self._calculate_freshness(article, now)
+        quality_score = self._calculate_quality(article)
+
+        return (
+            importance_score * SCORE_IMPORTANCE_WEIGHT / 100
+            + relevance_score * SCORE_RELEVANCE_WEIGHT / 100
+            + freshness_score * SCORE_FRESHNESS_WEIGHT / 100
+            + quality_score * SCORE_QUALITY_WEIGHT / 100
+        )
+
+    def _score_batch(
+        self,
+        articles: list[ArticleDigest],
+        interests: list[str],
+        now: datetime,
+        top_relevance: float = 0.0,
+    ) -> None:
+        """Score all articles at once with NumPy.
+
+        Computes the same four factors as the per-article methods, in the
+        same floating point order, so the scores are identical.
+
+        Args:
+            articles: Articles to score, updated in place
+            interests: User interests
+            now: Reference time for freshness
+            top_relevance: Best full-text relevance in the pool
+
+        """
+        batch = ArticleBatch.from_articles(articles)
+        column = batch.column
+
+        # Importance: source weight (0.5-2.0 normalized to 0-10) plus
+        # points for having content and topic tags
+        importance = np.minimum(
+            10, np.maximum(0, (column("source_weight") - 0.5) * 10 / 1.5)
+        )
+        importance = importance + np.where(column("content_length") > 0, 10, 0)
+        importance = importance + np.where(column("topic_count") > 0, 5, 0)
+        importance = np.minimum(100, importance)
+
+        # Relevance matches text, which has no columnar form
+        relevance = np.fromiter(
+            (
+                self._calculate_relevance(article, interests, top_relevance)
+                for article in articles
+            ),
+            dtype=np.float64,
+            count=len(articles),
+        )
+
+        # Freshness: age in hours from whole microseconds, like timedelta does
+        now_us = (now - _EPOCH) // timedelta(microseconds=1)
+        age_hours = (now_us - column("published_at") * 1e6) / 1e6 / 3600
+        freshness = np.select(
+            [
+                np.isnan(age_hours),
+                age_hours < FRESHNESS_EXCELLENT,
+                age_hours < FRESHNESS_GOOD,
+                age_hours < FRESHNESS_FAIR,
+            ],
+            [50, 100, 75, 50],
+            default=np.maximum(0, 50 - (age_hours / 24 * 10)),
+        )
+
+        # Quality: length band, summary, author and readability
+        words = column("word_count")
+        in_range = (words >= QUALITY_MIN_LENGTH) & (words <= QUALITY_MAX_LENGTH)
+        quality = 50.0 + np.select(
+            [
+                in_range & (np.abs(words - QUALITY_IDEAL_LENGTH) < 200),
+                in_range,
+                words < QUALITY_MIN_LENGTH,
+            ],
+            [20, 10, -10],
+            default=-5,
+        )
+        summary_length = column("summary_length")
+        quality = quality + np.where(summary_length > 50, 10, 0)
+        quality = quality + np.where(column("has_author") > 0, 5, 0)
+        avg_word_length = column("summary_word_length")
+        quality = quality + np.where(
+            (summary_length > 0) & (avg_word_length >= 4) & (avg_word_length <= 7), 10, 0
+        )
+        quality = np.minimum(100, np.maximum(0, quality))
+
+        # Weighted total score (0-100)
+        scores = (
+            importance * SCORE_IMPORTANCE_WEIGHT / 100
+            + relevance * SCORE_RELEVANCE_WEIGHT / 100
+            + freshness * SCORE_FRESHNESS_WEIGHT / 100
+            + quality * SCORE_QUALITY_WEIGHT / 100
+        )
+
+        for article, score in zip(articles, scores.tolist()):
+            article.score = score
+
+    def _calculate_importance(self, article: ArticleDigest) -> float:
         """Calculate importance score (0-100).
 
         Args:
@@ -149,19 +299,22 @@ class ArticleSelector:
         # - Impact prediction via AI (+0 to +40)
 
         # For now, give a base importance based on presence of content
-        if article.content:
+        if article.content_length:
             score += 10  # Has full content
         if article.topics:
             score += 5  # Has topic tags
 
         return min(100, score)
 
-    def _calculate_relevance(self, article: Article, interests: list[str]) -> float:
+    def _calculate_relevance(
+        self, article: ArticleDigest, interests: list[str], top_relevance: float = 0.0
+    ) -> float:
         """Calculate relevance score based on user interests (0-100).
 
         Args:
             article: Article to score
             interests: User interests
+            top_relevance: Best full-text relevance in the pool
 
         Returns:
             Relevance score
@@ -171,36 +324,53 @@ class ArticleSelector:
             return 50  # Neutral score if no interests
 
         score = 0.0
+        matcher = self._get_matcher(interests)
 
         # Check title and content for interest keywords
-        text = (article.title + " " + article.summary).lower()
-        interests_lower = [i.lower() for i in interests]
-
-        matches = sum(1 for interest in interests_lower if interest in text)
+        matches = matcher.count(article.title + " " + article.summary)
 
         if matches > 0:
             score += min(30, matches * 15)  # +15 per match, max 30
 
         # Check topic alignment
         if article.topics:
-            topics_lower = [t.lower() for t in article.topics]
-            topic_matches = sum(
-                1 for interest in interests_lower if any(interest in t for t in topics_lower)
-            )
+            topic_matches = len(set().union(*map(matcher.find, article.topics)))
             if topic_matches > 0:
                 score += min(20, topic_matches * 10)  # +10 per match, max 20
 
+        # Full-text rank from the candidate query, relative to the best match
+        if article.relevance > 0 and top_relevance > 0:
+            score += 50 * article.relevance / top_relevance  # max 50
+
         # If no matches, give a small base score
         if score == 0:
             score = 20
 
         return min(100, score)
 
-    def _calculate_freshness(self, article: Article) -> float:
+    def _get_matcher(self, interests: list[str]) -> InterestMatcher:
+        """Get the interest matcher, rebuilding it if the interests changed.
+
+        Args:
+            interests: User interests
+
+        Returns:
+            Matcher for the interests
+
+        """
+        if self._matcher is None or self._matcher.interests != interests:
+            self._matcher = InterestMatcher(interests)
+
+        return self._matcher
+
+    def _calculate_freshness(
+        self, article: ArticleDigest, now: datetime | None = None
+    ) -> float:
         """Calculate freshness score based on publish date (0-100).
 
         Args:
             article: Article to score
+            now: Reference time (defaults to now)
 
         Returns:
             Freshness score
@@ -209,7 +379,7 @@ class ArticleSelector:
         if not article.published_at:
             return 50  # Unknown date gets neutral score
 
-        now = datetime.now()
+        now = now or datetime.now()
         age_hours = (now - article.published_at).total_seconds() / 3600
 
         if age_hours < FRESHNESS_EXCELLENT:
@@ -223,7 +393,7 @@ class ArticleSelector:
             days_old = age_hours / 24
             return max(0, 50 - (days_old * 10))
 
-    def _calculate_quality(self, article: Article) -> float:
+    def _calculate_quality(self, article: ArticleDigest) -> float:
         """Calculate quality score based on content characteristics (0-100).
 
         Args:
@@ -236,7 +406,7 @@ class ArticleSelector:
         score = 50.0  # Base score
 
         # Content length
-        content_words = len((article.content or article.summary).split())
+        content_words = article.word_count
 
         if QUALITY_MIN_LENGTH <= content_words <= QUALITY_MAX_LENGTH:
             # Within ideal range
@@ -269,11 +439,11 @@ class ArticleSelector:
 
     async def _llm_select(
         self,
-        articles: list[Article],
+        articles: list[ArticleDigest],
         count: int,
         interests: list[str],
         **kwargs: Any,
-    ) -> list[Article]:
+    ) -> list[ArticleDigest]:
         """Use LLM to select articles.
 
         Args:
@@ -286,7 +456,7 @@ class ArticleSelector:
             Selected articles
 
         """
-        # Convert articles to dict format for LLM
+        # Convert articles to dict format for LLM (digests carry no body)
         article_dicts = [article.to_dict() for article in articles]
 
         # Call LLM
@@ -297,13 +467,15 @@ class ArticleSelector:
         # Extract selected article IDs
         selected_ids = [item["id"] for item in result.get("selected", [])]
 
-        # Find corresponding Article objects
+        # Find corresponding digests
         article_map = {article.id: article for article in articles}
         selected = [article_map[aid] for aid in selected_ids if aid in article_map]
 
         return selected
 
-    def _fallback_select(self, articles: list[Article], count: int) -> list[Article]:
+    def _fallback_select(
+        self, articles: list[ArticleDigest], count: int
+    ) -> list[ArticleDigest]:
         """Fallback selection based on scores only.
 
         Args:
@@ -314,13 +486,17 @@ class ArticleSelector:
             Selected articles
 
         """
-        return sorted(articles, key=lambda a: a.score, reverse=True)[:count]
+        return heapq.nlargest(count, articles, key=_score_key)
 
     def _ensure_diversity(
-        self, articles: list[Article], target_count: int
-    ) -> list[Article]:
+        self, articles: list[ArticleDigest], target_count: int
+    ) -> list[ArticleDigest]:
         """Ensure topic diversity in selection.
 
+        The top article of each language is kept first, then the remaining
+        slots are filled by maximal marginal relevance over title, summary
+        and topic vectors.
+
         Args:
             articles: Selected articles
             target_count: Target number of articles
@@ -332,44 +508,11 @@ class ArticleSelector:
         if len(articles) <= target_count:
             return articles
 
-        # Group by language
-        by_language: dict[str, list[Article]] = {}
-        for article in articles:
-            lang = article.language
-            if lang not in by_language:
-                by_language[lang] = []
-            by_language[lang].append(article)
-
         # Ensure at least one from each language represented
-        diverse_selection: list[Article] = []
-        seen_topics: set[str] = set()
-
-        # First pass: one per language
-        for articles_in_lang in by_language.values():
-            if articles_in_lang:
-                diverse_selection.append(articles_in_lang[0])
-
-        # Second pass: fill remaining slots with highest scores
-        # avoiding topic duplication
-        remaining = [a for a in articles if a not in diverse_selection]
-
-        for article in sorted(remaining, key=lambda a: a.score, reverse=True):
-            if len(diverse_selection) >= target_count:
-                break
-
-            # Check topic diversity
-            article_topics = set(article.topics)
-            if not article_topics or not article_topics.intersection(seen_topics):
-                diverse_selection.append(article)
-                seen_topics.update(article_topics)
-
-        # If still not enough, add remaining by score
-        if len(diverse_selection) < target_count:
-            remaining = [a for a in articles if a not in diverse_selection]
-            diverse_selection.extend(
-                sorted(remaining, key=lambda a: a.score, reverse=True)[
-                    : target_count - len(diverse_selection)
-                ]
-            )
+        first_by_language: dict[str, str] = {}
+        for article in articles:
+            first_by_language.setdefault(article.language, article.id)
 
-        return diverse_selection[:target_count]
+        return mmr_rerank(
+            articles, target_count, seed_ids=first_by_language.values()
+        )
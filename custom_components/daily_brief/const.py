@@ -20,6 +20,8 @@ CONF_GENERATION_TIME: Final = "generation_time"
 CONF_AUTO_PLAY: Final = "auto_play"
 CONF_AUTO_PLAY_TIME: Final = "auto_play_time"
 CONF_MEDIA_PLAYER: Final = "media_player"
+CONF_PARSE_WORKERS: Final = "parse_workers"
+CONF_TTS_CONCURRENCY: Final = "tts_concurrency"
 
 # Default values
 DEFAULT_LLM_PROVIDER: Final = "openai"
@@ -66,8 +68,17 @@ QUALITY_MIN_LENGTH: Final = 500  # words
 QUALITY_MAX_LENGTH: Final = 3000  # words
 QUALITY_IDEAL_LENGTH: Final = 1500  # words
 
+# Diversity reranking (maximal marginal relevance)
+DIVERSITY_TRADEOFF: Final = 0.7  # 1.0 ranks by score only, 0.0 by novelty only
+DIVERSITY_TITLE_WEIGHT: Final = 2  # weight of a title term against a summary term
+DIVERSITY_TOPIC_WEIGHT: Final = 3  # weight of a topic tag against a summary term
+
 # Deduplication threshold
 DEDUP_SIMILARITY_THRESHOLD: Final = 0.8
+DEDUP_SHINGLE_SIZE: Final = 3  # characters
+DEDUP_MINHASH_PERMUTATIONS: Final = 64
+DEDUP_SIMHASH_MAX_DISTANCE: Final = 6  # bits
+DEDUP_HISTORY_DAYS: Final = 3
 
 # Services
 SERVICE_GENERATE: Final = "generate"
@@ -105,20 +116,52 @@ STATUS_ERROR: Final = "error"
 STORAGE_DIR: Final = "www/daily_brief"
 DATABASE_NAME: Final = "daily_brief.db"
 
+# Database tuning
+DATABASE_READ_CONNECTIONS: Final = 2
+DATABASE_PRAGMAS: Final = {
+    "synchronous": "NORMAL",  # durable with WAL, without an fsync per commit
+    "cache_size": -8192,  # KiB
+    "mmap_size": 67108864,  # 64 MiB
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms
+}
+
 # Audio settings
 AUDIO_FORMAT: Final = "mp3"
 AUDIO_SAMPLE_RATE: Final = 22050
 AUDIO_READING_SPEED: Final = 150  # words per minute
+AUDIO_BITRATE: Final = "128k"
+DEFAULT_TTS_CONCURRENCY: Final = 4  # segments synthesized at the same time
+TTS_CACHE_DIR: Final = "tts_cache"  # under the storage directory
+TTS_CACHE_MAX_BYTES: Final = 200 * 1024 * 1024
 
 # API limits and timeouts
 API_TIMEOUT: Final = 60  # seconds
 MAX_RETRIES: Final = 3
 RETRY_DELAY: Final = 2  # seconds
 MAX_CONCURRENT_FETCHES: Final = 10
+FETCH_CONNECTIONS_PER_HOST: Final = 4
+FETCH_DNS_CACHE_TTL: Final = 300  # seconds
+FETCH_KEEPALIVE_TIMEOUT: Final = 60  # seconds
+STREAM_CHUNK_SIZE: Final = 65536  # bytes
+STREAM_KNOWN_RUN: Final = 5  # consecutive already seen items before stopping
+
+# Feed parsing worker processes (0 parses in the default thread executor)
+DEFAULT_PARSE_WORKERS: Final = 0
 
 # Cache settings
 CACHE_DURATION: Final = 3600  # 1 hour in seconds
 FEED_FETCH_INTERVAL: Final = 1800  # 30 minutes
+ARTICLE_POOL_DAYS: Final = 2  # ingested articles considered for a briefing
+ARTICLE_CANDIDATE_LIMIT: Final = 500  # pool articles scored for a briefing
+
+# Adaptive fetch scheduling
+SCHEDULER_MIN_INTERVAL: Final = 900  # 15 minutes
+SCHEDULER_MAX_INTERVAL: Final = 21600  # 6 hours
+SCHEDULER_MAX_BACKOFF: Final = 86400  # 1 day
+SCHEDULER_SMOOTHING: Final = 0.5  # weight of the latest cadence observation
+SCHEDULER_UNCHANGED_FACTOR: Final = 1.5  # interval stretch when nothing changed
+SCHEDULER_CADENCE_SAMPLE: Final = 20  # newest items used to estimate cadence
 
 # Cost limits (USD)
 MAX_COST_PER_BRIEFING: Final = 0.50
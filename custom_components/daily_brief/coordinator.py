@@ -1,12 +1,14 @@
 """Data coordinator for Daily Brief integration."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -55,6 +57,7 @@ class DailyBriefCoordinator(DataUpdateCoordinator):
         self._status = STATUS_IDLE
         self._current_briefing: dict[str, Any] | None = None
         self._progress = 0
+        self._ingest_task: asyncio.Task | None = None
 
     @property
     def config(self) -> dict[str, Any]:
@@ -183,6 +186,15 @@ class DailyBriefCoordinator(DataUpdateCoordinator):
         """Shutdown the coordinator."""
         _LOGGER.debug("Shutting down Daily Brief coordinator")
 
+        # Stop a running ingestion before the database goes away
+        if self._ingest_task is not None and not self._ingest_task.done():
+            self._ingest_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ingest_task
+
+        if self.orchestrator:
+            await self.orchestrator.async_shutdown()
+
         if self.database:
             await self.database.async_close()
 
@@ -210,9 +222,13 @@ class DailyBriefCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint.
 
-        This is called periodically to update cached data.
-        For now, it returns current status.
+        This is called periodically to ingest due feeds into the database in
+        the background, so generating a briefing does not wait on the network.
+        The ingestion runs as its own task, so refreshes (including a first
+        refresh during setup) never wait for it either.
         """
+        self._schedule_ingest()
+
         try:
             return {
                 "status": self._status,
@@ -222,3 +238,24 @@ class DailyBriefCoordinator(DataUpdateCoordinator):
             }
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    @callback
+    def _schedule_ingest(self) -> None:
+        """Start a background feed ingestion unless one is already running."""
+        # Don't compete with a running generation for the feeds
+        if self.orchestrator is None or self.orchestrator.is_generating():
+            return
+
+        if self._ingest_task is not None and not self._ingest_task.done():
+            return
+
+        self._ingest_task = self.entry.async_create_background_task(
+            self.hass, self._async_ingest(), f"{DOMAIN} feed ingestion"
+        )
+
+    async def _async_ingest(self) -> None:
+        """Ingest due feeds, logging instead of raising on failure."""
+        try:
+            await self.orchestrator.async_ingest()
+        except Exception as err:
+            _LOGGER.warning("Background feed ingestion failed: %s", err)
@@ -6,11 +6,14 @@ from .content_packs import (
     list_content_packs,
 )
 from .dedup import Deduplicator
-from .parser import FeedParser
+from .parser import FeedParser, create_feed_session
+from .scheduler import FetchScheduler
 
 __all__ = [
     "FeedParser",
+    "create_feed_session",
     "Deduplicator",
+    "FetchScheduler",
     "CONTENT_PACKS",
     "get_content_pack",
     "list_content_packs",
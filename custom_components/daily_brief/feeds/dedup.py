@@ -2,14 +2,406 @@
 from __future__ import annotations
 
 import logging
-from difflib import SequenceMatcher
-from typing import Any
-
-from ..const import DEDUP_SIMILARITY_THRESHOLD
+import random
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Hashable, Iterable
+
+from ..const import (
+    DEDUP_MINHASH_PERMUTATIONS,
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_SIMHASH_MAX_DISTANCE,
+    DEDUP_SIMILARITY_THRESHOLD,
+)
 from ..storage.models import Article
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mersenne prime used for the universal hash family of the MinHash permutations
+_MERSENNE_PRIME = (1 << 61) - 1
+_EMPTY_BIN = _MERSENNE_PRIME
+# Keeps values borrowed by empty bins distinct from the bin they came from
+_DENSIFY_OFFSET = _MERSENNE_PRIME
+
+# Only the beginning of the body is compared, as in the title/summary check
+_CONTENT_PREFIX_LENGTH = 500
+
+SIMHASH_BITS = 64
+_SIMHASH_MASK = (1 << SIMHASH_BITS) - 1
+# Below this many shingles a one-word edit moves too many SimHash bits, so
+# short texts are compared by title instead
+_SIMHASH_MIN_SHINGLES = 256
+# Per-bit vote counters are packed into 16-bit lanes of one integer
+_SIMHASH_LANE = 16
+_SIMHASH_LANE_MASK = (1 << _SIMHASH_LANE) - 1
+# _SIMHASH_SPREAD[k][b] spreads the bits of byte k of a hash into their lanes
+_SIMHASH_SPREAD = [
+    [
+        sum(((byte >> bit) & 1) << ((8 * k + bit) * _SIMHASH_LANE) for bit in range(8))
+        for byte in range(256)
+    ]
+    for k in range(SIMHASH_BITS // 8)
+]
+
+
+def shingle(text: str, size: int = DEDUP_SHINGLE_SIZE) -> frozenset[int]:
+    """Split text into a set of hashed character shingles.
+
+    Character shingles work for both space-separated and CJK text.
+
+    Args:
+        text: Text to shingle
+        size: Shingle length in characters
+
+    Returns:
+        Set of 32-bit shingle hashes
+
+    """
+    normalized = " ".join(text.lower().split())
+    if not normalized:
+        return frozenset()
+
+    if len(normalized) <= size:
+        return frozenset((zlib.crc32(normalized.encode()),))
+
+    return frozenset(
+        zlib.crc32(normalized[i : i + size].encode())
+        for i in range(len(normalized) - size + 1)
+    )
+
+
+def _mix64(value: int) -> int:
+    """Spread a 32-bit shingle hash over 64 well-mixed bits (splitmix64)."""
+    value = (value + 0x9E3779B97F4A7C15) & _SIMHASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _SIMHASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _SIMHASH_MASK
+    return value ^ (value >> 31)
+
+
+def simhash(text: str) -> int:
+    """Compute the 64-bit SimHash fingerprint of a text.
+
+    Near-identical texts get fingerprints within a small Hamming distance of
+    each other, which makes them cheap to store and compare across runs.
+    The features are the character shingles used for deduplication, so a
+    one-word edit only changes the few shingles that overlap it.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Unsigned 64-bit fingerprint, 0 for an empty text
+
+    """
+    features = [_mix64(value) for value in shingle(text)]
+    if not features:
+        return 0
+
+    spread = _SIMHASH_SPREAD
+    votes = 0
+    for feature in features:
+        for k in range(SIMHASH_BITS // 8):
+            votes += spread[k][(feature >> (8 * k)) & 0xFF]
+
+    half = len(features) / 2
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if ((votes >> (bit * _SIMHASH_LANE)) & _SIMHASH_LANE_MASK) > half:
+            fingerprint |= 1 << bit
+
+    return fingerprint
+
+
+def _fingerprint_text(article: Article) -> str:
+    """Return the title and beginning of the body that SimHash covers."""
+    body = (article.summary or article.content)[:_CONTENT_PREFIX_LENGTH]
+    return f"{article.title} {body}"
+
+
+def article_simhash(article: Article) -> int:
+    """Compute the SimHash fingerprint of an article's title and summary."""
+    return simhash(_fingerprint_text(article))
+
+
+def hamming_distance(fingerprint1: int, fingerprint2: int) -> int:
+    """Count the differing bits of two fingerprints."""
+    return ((fingerprint1 ^ fingerprint2) & _SIMHASH_MASK).bit_count()
+
+
+def dice_similarity(shingles1: frozenset[int], shingles2: frozenset[int]) -> float:
+    """Calculate the Dice coefficient of two shingle sets.
+
+    The Dice coefficient (2|A∩B| / (|A| + |B|)) is on the same scale as the
+    ``SequenceMatcher.ratio`` used previously, so existing thresholds keep
+    their meaning.
+
+    Args:
+        shingles1: First shingle set
+        shingles2: Second shingle set
+
+    Returns:
+        Similarity ratio (0.0-1.0)
+
+    """
+    if not shingles1 or not shingles2:
+        return 0.0
+
+    return 2 * len(shingles1 & shingles2) / (len(shingles1) + len(shingles2))
+
+
+def dice_to_jaccard(threshold: float) -> float:
+    """Convert a Dice similarity threshold to the equivalent Jaccard threshold."""
+    return threshold / (2 - threshold)
+
+
+class MinHashLSH:
+    """MinHash signatures indexed with LSH banding.
+
+    Items whose shingle sets have a Jaccard similarity above the threshold
+    share at least one band bucket with high probability, so candidate
+    lookups cost O(bands) instead of a scan over every indexed item.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int = DEDUP_MINHASH_PERMUTATIONS,
+        seed: int = 1,
+    ) -> None:
+        """Initialize index.
+
+        Args:
+            threshold: Jaccard similarity threshold (0.0-1.0)
+            num_perm: Number of MinHash permutations
+            seed: Seed for the hash permutation
+
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = self._optimal_bands(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._permutation = (
+            rng.randint(1, _MERSENNE_PRIME - 1),
+            rng.randint(0, _MERSENNE_PRIME - 1),
+        )
+
+        self._buckets: list[dict[tuple[int, ...], set[Hashable]]] = [
+            defaultdict(set) for _ in range(self.bands)
+        ]
+        self._keys: dict[Hashable, list[tuple[int, ...]]] = {}
+
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+        """Pick the band/row split whose S-curve midpoint sits at or just below the threshold.
+
+        Erring low trades a few extra candidates (which are verified exactly)
+        for fewer missed duplicates.
+        """
+        best = (num_perm, 1)
+        best_distance = float("inf")
+
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            midpoint = (1 / bands) ** (1 / rows)
+            if midpoint > threshold:
+                continue
+            distance = threshold - midpoint
+            if distance < best_distance:
+                best, best_distance = (bands, rows), distance
+
+        return best
+
+    def signature(self, shingles: Iterable[int]) -> list[int]:
+        """Compute the MinHash signature of a shingle set.
+
+        Uses one-permutation hashing: every shingle is hashed once and lands
+        in one of ``num_perm`` bins, keeping the minimum per bin. Empty bins
+        borrow from the next filled bin (rotation densification), so the
+        cost is O(shingles + num_perm) instead of O(shingles * num_perm).
+
+        Args:
+            shingles: Hashed shingles
+
+        Returns:
+            Signature of ``num_perm`` values, empty for an empty set
+
+        """
+        num_perm = self.num_perm
+        a, b = self._permutation
+        signature = [_EMPTY_BIN] * num_perm
+
+        for x in shingles:
+            value = (a * x + b) % _MERSENNE_PRIME
+            bin_idx = value % num_perm
+            value //= num_perm
+            if value < signature[bin_idx]:
+                signature[bin_idx] = value
+
+        filled = [idx for idx, value in enumerate(signature) if value != _EMPTY_BIN]
+        if not filled:
+            # Empty texts are never indexed, otherwise they would all collide
+            return []
+
+        if len(filled) < num_perm:
+            source = filled[0]
+            for idx in range(num_perm - 1, -1, -1):
+                if signature[idx] == _EMPTY_BIN:
+                    distance = (source - idx) % num_perm
+                    signature[idx] = signature[source] + distance * _DENSIFY_OFFSET
+                else:
+                    source = idx
+
+        return signature
+
+    def _band_keys(self, signature: list[int]) -> list[tuple[int, ...]]:
+        """Split a signature into per-band bucket keys."""
+        rows = self.rows
+        return [tuple(signature[i * rows : (i + 1) * rows]) for i in range(self.bands)]
+
+    def insert(self, key: Hashable, signature: list[int]) -> None:
+        """Add an item to the index.
+
+        Args:
+            key: Item identifier
+            signature: MinHash signature of the item
+
+        """
+        if not signature:
+            return
+
+        band_keys = self._band_keys(signature)
+        self._keys[key] = band_keys
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets[band_key].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove an item from the index.
+
+        Args:
+            key: Item identifier
+
+        """
+        band_keys = self._keys.pop(key, None)
+        if band_keys is None:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if not bucket:
+                del buckets[band_key]
+
+    def query(self, signature: list[int]) -> set[Hashable]:
+        """Find candidate items sharing at least one band with the signature.
+
+        Args:
+            signature: MinHash signature to look up
+
+        Returns:
+            Set of candidate item identifiers
+
+        """
+        candidates: set[Hashable] = set()
+        if not signature:
+            return candidates
+
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets.get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        return len(self._keys)
+
+
+class SimHashIndex:
+    """Hamming-distance lookup over SimHash fingerprints.
+
+    Fingerprints are split into ``max_distance + 1`` bands; by the pigeonhole
+    principle two fingerprints within ``max_distance`` bits agree exactly on
+    at least one band, so only items sharing a band bucket are compared.
+    """
+
+    def __init__(self, max_distance: int = DEDUP_SIMHASH_MAX_DISTANCE) -> None:
+        """Initialize index.
+
+        Args:
+            max_distance: Maximum Hamming distance for a match
+
+        """
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = SIMHASH_BITS // bands
+        self._bands = [
+            (i * width, (1 << (SIMHASH_BITS - i * width if i == bands - 1 else width)) - 1)
+            for i in range(bands)
+        ]
+        self._buckets: list[dict[int, list[tuple[int, Hashable]]]] = [
+            defaultdict(list) for _ in self._bands
+        ]
+        self._size = 0
+
+    def add(self, key: Hashable, fingerprint: int) -> None:
+        """Add a fingerprint to the index.
+
+        Args:
+            key: Item identifier
+            fingerprint: SimHash fingerprint
+
+        """
+        if not fingerprint:
+            return
+
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            buckets[(fingerprint >> shift) & mask].append((fingerprint, key))
+        self._size += 1
+
+    def find(self, fingerprint: int) -> Hashable | None:
+        """Find an indexed item within the maximum Hamming distance.
+
+        Args:
+            fingerprint: SimHash fingerprint to look up
+
+        Returns:
+            Identifier of a matching item, or None
+
+        """
+        if not fingerprint:
+            return None
+
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            for candidate, key in buckets.get((fingerprint >> shift) & mask, ()):
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return key
+        return None
+
+    def __len__(self) -> int:
+        """Return the number of indexed fingerprints."""
+        return self._size
+
+
+class _Fingerprint:
+    """Shingles and MinHash signatures of one article."""
+
+    __slots__ = ("title", "content", "title_signature", "content_signature")
+
+    def __init__(
+        self, article: Article, title_index: MinHashLSH, content_index: MinHashLSH
+    ) -> None:
+        """Compute the fingerprint of an article."""
+        self.title = shingle(article.title)
+        self.content = shingle((article.summary or article.content)[:_CONTENT_PREFIX_LENGTH])
+        self.title_signature = title_index.signature(self.title)
+        self.content_signature = content_index.signature(self.content)
+
 
 class Deduplicator:
     """Article deduplication engine."""
@@ -23,9 +415,17 @@ class Deduplicator:
         """
         self.similarity_threshold = similarity_threshold
 
+    def _new_indexes(self) -> tuple[MinHashLSH, MinHashLSH]:
+        """Create empty title and content LSH indexes."""
+        jaccard_threshold = dice_to_jaccard(self.similarity_threshold)
+        return MinHashLSH(jaccard_threshold), MinHashLSH(jaccard_threshold)
+
     def deduplicate(self, articles: list[Article]) -> list[Article]:
         """Remove duplicate articles from list.
 
+        When two articles are similar the one with the higher score is kept,
+        or the first one if scores are equal.
+
         Args:
             articles: List of articles to deduplicate
 
@@ -38,35 +438,56 @@ class Deduplicator:
 
         _LOGGER.debug("Deduplicating %d articles", len(articles))
 
-        unique_articles: list[Article] = []
-        seen_urls: set[str] = set()
+        title_index, content_index = self._new_indexes()
 
-        for article in articles:
+        # Kept articles by position in the input, in insertion order
+        unique: dict[int, Article] = {}
+        fingerprints: dict[int, _Fingerprint] = {}
+        seen_urls: dict[str, int] = {}
+
+        for position, article in enumerate(articles):
             # Skip if exact URL match
             if article.url in seen_urls:
                 _LOGGER.debug("Skipping duplicate URL: %s", article.url)
                 continue
 
-            # Check similarity with existing articles
+            fingerprint = _Fingerprint(article, title_index, content_index)
+            candidates = title_index.query(fingerprint.title_signature)
+            candidates |= content_index.query(fingerprint.content_signature)
+
+            # Check similarity with existing articles, oldest first
             is_duplicate = False
-            for existing in unique_articles:
-                if self._are_similar(article, existing):
-                    _LOGGER.debug(
-                        "Found duplicate: '%s' similar to '%s'",
-                        article.title[:50],
-                        existing.title[:50],
-                    )
-                    # Keep the one with higher score, or the first one if scores are equal
-                    if article.score > existing.score:
-                        unique_articles.remove(existing)
-                        seen_urls.remove(existing.url)
-                    else:
-                        is_duplicate = True
-                        break
+            for kept in sorted(candidates):
+                existing = unique[kept]
+                if not self._are_fingerprints_similar(
+                    article, fingerprint, existing, fingerprints[kept]
+                ):
+                    continue
+
+                _LOGGER.debug(
+                    "Found duplicate: '%s' similar to '%s'",
+                    article.title[:50],
+                    existing.title[:50],
+                )
+                # Keep the one with higher score, or the first one if scores are equal
+                if article.score > existing.score:
+                    del unique[kept]
+                    del fingerprints[kept]
+                    del seen_urls[existing.url]
+                    title_index.remove(kept)
+                    content_index.remove(kept)
+                else:
+                    is_duplicate = True
+                    break
 
             if not is_duplicate:
-                unique_articles.append(article)
-                seen_urls.add(article.url)
+                unique[position] = article
+                fingerprints[position] = fingerprint
+                seen_urls[article.url] = position
+                title_index.insert(position, fingerprint.title_signature)
+                content_index.insert(position, fingerprint.content_signature)
+
+        unique_articles = list(unique.values())
 
         removed_count = len(articles) - len(unique_articles)
         if removed_count > 0:
@@ -74,6 +495,107 @@ class Deduplicator:
 
         return unique_articles
 
+    def filter_seen(
+        self, articles: list[Article], history: dict[str, tuple[int, str]]
+    ) -> list[Article]:
+        """Drop articles already stored in an earlier run.
+
+        Stories are matched by SimHash. Articles with too little text for a
+        reliable fingerprint fall back to comparing titles through MinHash,
+        like deduplicate() does within a run.
+
+        Args:
+            articles: Freshly fetched articles
+            history: SimHash fingerprints and titles of stored articles by article ID
+
+        Returns:
+            Articles that are neither stored nor near-duplicates of stored ones
+
+        """
+        if not articles or not history:
+            return articles
+
+        index = SimHashIndex()
+        for article_id, (fingerprint, _title) in history.items():
+            index.add(article_id, fingerprint)
+
+        # Only built when a short article needs it
+        title_index: MinHashLSH | None = None
+        titles: dict[str, frozenset[int]] = {}
+
+        new_articles = []
+        for article in articles:
+            if article.id in history:
+                continue
+
+            match = index.find(article.simhash)
+            if match is None and (
+                len(shingle(_fingerprint_text(article))) < _SIMHASH_MIN_SHINGLES
+            ):
+                if title_index is None:
+                    title_index = MinHashLSH(dice_to_jaccard(self.similarity_threshold))
+                    for article_id, (_fingerprint, title) in history.items():
+                        titles[article_id] = shingle(title)
+                        title_index.insert(
+                            article_id, title_index.signature(titles[article_id])
+                        )
+                match = self._find_title(article, title_index, titles)
+
+            if match is not None:
+                _LOGGER.debug(
+                    "Skipping previously seen story '%s' (matches %s)",
+                    article.title[:50],
+                    match,
+                )
+                continue
+
+            new_articles.append(article)
+
+        removed_count = len(articles) - len(new_articles)
+        if removed_count > 0:
+            _LOGGER.info("Removed %d previously seen articles", removed_count)
+
+        return new_articles
+
+    def _find_title(
+        self,
+        article: Article,
+        title_index: MinHashLSH,
+        titles: dict[str, frozenset[int]],
+    ) -> str | None:
+        """Find an indexed title similar to the article's title."""
+        title = shingle(article.title)
+        for candidate in sorted(title_index.query(title_index.signature(title))):
+            if dice_similarity(title, titles[candidate]) >= self.similarity_threshold:
+                return candidate
+        return None
+
+    def _are_fingerprints_similar(
+        self,
+        article1: Article,
+        fingerprint1: _Fingerprint,
+        article2: Article,
+        fingerprint2: _Fingerprint,
+    ) -> bool:
+        """Check precomputed fingerprints of two articles for similarity."""
+        # Must be same language
+        if article1.language != article2.language:
+            return False
+
+        # Calculate title similarity
+        title_similarity = dice_similarity(fingerprint1.title, fingerprint2.title)
+
+        if title_similarity >= self.similarity_threshold:
+            return True
+
+        # If titles are somewhat similar, check content
+        if title_similarity >= 0.5:
+            content_similarity = dice_similarity(fingerprint1.content, fingerprint2.content)
+            if content_similarity >= self.similarity_threshold:
+                return True
+
+        return False
+
     def _are_similar(self, article1: Article, article2: Article) -> bool:
         """Check if two articles are similar enough to be considered duplicates.
 
@@ -90,22 +612,18 @@ class Deduplicator:
             return False
 
         # Calculate title similarity
-        title_similarity = self._calculate_similarity(
-            article1.title.lower(), article2.title.lower()
-        )
+        title_similarity = self._calculate_similarity(article1.title, article2.title)
 
         if title_similarity >= self.similarity_threshold:
             return True
 
         # If titles are somewhat similar, check content
         if title_similarity >= 0.5:
-            content1 = (article1.summary or article1.content)[:500]
-            content2 = (article2.summary or article2.content)[:500]
+            content1 = (article1.summary or article1.content)[:_CONTENT_PREFIX_LENGTH]
+            content2 = (article2.summary or article2.content)[:_CONTENT_PREFIX_LENGTH]
 
             if content1 and content2:
-                content_similarity = self._calculate_similarity(
-                    content1.lower(), content2.lower()
-                )
+                content_similarity = self._calculate_similarity(content1, content2)
                 if content_similarity >= self.similarity_threshold:
                     return True
 
@@ -125,7 +643,7 @@ class Deduplicator:
         if not text1 or not text2:
             return 0.0
 
-        return SequenceMatcher(None, text1, text2).ratio()
+        return dice_similarity(shingle(text1), shingle(text2))
 
     def merge_duplicates(
         self, articles: list[Article], preserve: str = "highest_score"
@@ -143,20 +661,35 @@ class Deduplicator:
         if not articles:
             return []
 
+        title_index, content_index = self._new_indexes()
+
+        # Groups are keyed by their first article's fingerprint, like before
         groups: list[list[Article]] = []
+        group_fingerprints: list[_Fingerprint] = []
 
         for article in articles:
+            fingerprint = _Fingerprint(article, title_index, content_index)
+            candidates = title_index.query(fingerprint.title_signature)
+            candidates |= content_index.query(fingerprint.content_signature)
+
             # Find matching group
             matched_group = None
-            for group in groups:
-                if self._are_similar(article, group[0]):
+            for group_idx in sorted(candidates):
+                group = groups[group_idx]
+                if self._are_fingerprints_similar(
+                    article, fingerprint, group[0], group_fingerprints[group_idx]
+                ):
                     matched_group = group
                     break
 
             if matched_group:
                 matched_group.append(article)
             else:
+                group_idx = len(groups)
                 groups.append([article])
+                group_fingerprints.append(fingerprint)
+                title_index.insert(group_idx, fingerprint.title_signature)
+                content_index.insert(group_idx, fingerprint.content_signature)
 
         # Select best article from each group
         merged_articles = []
@@ -1,29 +1,159 @@
 """RSS feed parser for Daily Brief."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import importlib.util
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
 from langdetect import LangDetectException, detect
-
-from ..const import API_TIMEOUT
+from lxml import etree
+
+from ..const import (
+    API_TIMEOUT,
+    FETCH_CONNECTIONS_PER_HOST,
+    FETCH_DNS_CACHE_TTL,
+    FETCH_KEEPALIVE_TIMEOUT,
+    MAX_CONCURRENT_FETCHES,
+    STREAM_CHUNK_SIZE,
+    STREAM_KNOWN_RUN,
+)
 from ..storage.models import Article
+from .dedup import article_simhash
 
 _LOGGER = logging.getLogger(__name__)
 
+# aiohttp only decodes Brotli responses when a Brotli package is installed
+_ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+_RSS_NAMESPACES = (
+    "",
+    "http://purl.org/rss/1.0/",
+    "http://my.netscape.com/rdf/simple/0.9/",
+    "http://backend.userland.com/rss2",
+)
+_ATOM_NAMESPACES = ("http://www.w3.org/2005/Atom", "http://purl.org/atom/ns#")
+_CONTENT_NAMESPACE = "http://purl.org/rss/1.0/modules/content/"
+_DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+_DCTERMS_NAMESPACE = "http://purl.org/dc/terms/"
+
+
+def _tag(namespace: str, name: str) -> str:
+    """Get the lxml tag of an element name in a namespace."""
+    return f"{{{namespace}}}{name}" if namespace else name
+
+
+# RSS 0.9x/1.0/2.0 <item> and Atom <entry> tags
+_ITEM_TAGS = frozenset(
+    [_tag(namespace, "item") for namespace in _RSS_NAMESPACES]
+    + [_tag(namespace, "entry") for namespace in _ATOM_NAMESPACES]
+)
+
+# Record field of each item child, by full tag. Extensions such as media:
+# and itunes: reuse local names like title and content, so children are
+# never matched by local name alone.
+_FIELD_TAGS: dict[str, str] = {
+    **{
+        _tag(namespace, name): field_name
+        for namespace in _RSS_NAMESPACES + _ATOM_NAMESPACES
+        for name, field_name in (
+            ("link", "link"),
+            ("guid", "guid"),
+            ("title", "title"),
+            ("description", "summary"),
+            ("summary", "summary"),
+            ("content", "content"),
+            ("pubDate", "published"),
+            ("published", "published"),
+            ("issued", "published"),
+            ("updated", "updated"),
+            ("modified", "updated"),
+            ("category", "category"),
+            ("author", "author"),
+        )
+    },
+    _tag(_CONTENT_NAMESPACE, "encoded"): "content",
+    _tag(_DC_NAMESPACE, "creator"): "author",
+    _tag(_DC_NAMESPACE, "date"): "updated",
+    _tag(_DC_NAMESPACE, "subject"): "category",
+    _tag(_DCTERMS_NAMESPACE, "issued"): "published",
+    _tag(_DCTERMS_NAMESPACE, "created"): "published",
+    _tag(_DCTERMS_NAMESPACE, "modified"): "updated",
+}
+
+
+def create_feed_session() -> aiohttp.ClientSession:
+    """Create an HTTP session tuned for fetching many feeds repeatedly.
+
+    Connections are pooled per host and kept alive between fetches, and DNS
+    lookups are cached, so feeds sharing a host reuse one TLS handshake.
+
+    Returns:
+        New client session, to be closed by the caller
+
+    """
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_FETCHES,
+        limit_per_host=FETCH_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=FETCH_DNS_CACHE_TTL,
+        keepalive_timeout=FETCH_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Accept-Encoding": _ACCEPT_ENCODING},
+        timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+    )
+
+
+@dataclass
+class FeedFetchResult:
+    """Result of a conditional feed fetch."""
+
+    articles: list[Article] = field(default_factory=list)
+    status: int | None = None  # HTTP status, None on network or parse errors
+    etag: str | None = None
+    last_modified: str | None = None
+    # Publish times of already stored items that were skipped while streaming
+    known_published: list[datetime] = field(default_factory=list)
+
+    @property
+    def not_modified(self) -> bool:
+        """Return True if the server reported the feed as unchanged."""
+        return self.status == 304
+
 
 class FeedParser:
     """RSS/Atom feed parser."""
 
-    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
-        """Initialize parser."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize parser.
+
+        Args:
+            session: HTTP session to use
+            executor: Executor that parses feed bodies, the event loop's
+                default executor if not specified
+
+        """
         self._session = session
         self._should_close_session = session is None
+        self._executor = executor
 
     async def __aenter__(self) -> FeedParser:
         """Async context manager entry."""
@@ -46,6 +176,35 @@ class FeedParser:
         Returns:
             List of Article objects
 
+        """
+        result = await self.fetch_feed_conditional(url, source_id)
+        return result.articles
+
+    async def fetch_feed_conditional(
+        self,
+        url: str,
+        source_id: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        known_ids: set[str] | None = None,
+    ) -> FeedFetchResult:
+        """Fetch and parse RSS feed unless it is unchanged since the last fetch.
+
+        The body is parsed while it streams in. Items whose article ID is in
+        ``known_ids`` are skipped, and after a run of them the rest of the
+        feed is not downloaded at all. Feeds the streaming parser does not
+        recognize are parsed with feedparser instead.
+
+        Args:
+            url: Feed URL
+            source_id: Optional source ID for tracking
+            etag: ETag returned by the previous fetch
+            last_modified: Last-Modified returned by the previous fetch
+            known_ids: IDs of articles already stored for this feed
+
+        Returns:
+            Fetch result with articles and the new validators
+
         """
         try:
             _LOGGER.debug("Fetching feed: %s", url)
@@ -53,165 +212,439 @@ class FeedParser:
             if not self._session:
                 self._session = aiohttp.ClientSession()
 
-            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)) as response:
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+            async with self._session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)
+            ) as response:
+                if response.status == 304:
+                    _LOGGER.debug("Feed not modified: %s", url)
+                    return FeedFetchResult(
+                        status=304, etag=etag, last_modified=last_modified
+                    )
+
                 if response.status != 200:
                     _LOGGER.warning("Failed to fetch feed %s: HTTP %d", url, response.status)
-                    return []
-
-                content = await response.text()
-
-            # Parse feed
-            feed = feedparser.parse(content)
-
-            if feed.bozo:
-                _LOGGER.warning("Feed %s has malformed XML: %s", url, feed.bozo_exception)
-
-            articles = []
-            for entry in feed.entries:
-                article = self._parse_entry(entry, source_id)
-                if article:
-                    articles.append(article)
+                    return FeedFetchResult(status=response.status)
+
+                new_etag = response.headers.get("ETag")
+                new_last_modified = response.headers.get("Last-Modified")
+                content_type = response.headers.get("Content-Type")
+                records, known_published, content = await self._stream_records(
+                    response, known_ids or set()
+                )
+
+            # Finish parsing off the event loop
+            loop = asyncio.get_running_loop()
+            if records is not None:
+                articles = await loop.run_in_executor(
+                    self._executor, parse_feed_records, records, source_id
+                )
+            else:
+                _LOGGER.debug("Feed %s not handled by streaming parser", url)
+                articles = await loop.run_in_executor(
+                    self._executor,
+                    parse_feed_content,
+                    content,
+                    url,
+                    source_id,
+                    content_type,
+                )
 
             _LOGGER.info("Parsed %d articles from %s", len(articles), url)
-            return articles
+            return FeedFetchResult(
+                articles=articles,
+                status=200,
+                etag=new_etag,
+                last_modified=new_last_modified,
+                known_published=known_published,
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error fetching feed %s: %s", url, err)
-            return []
+            return FeedFetchResult()
         except Exception as err:
             _LOGGER.error("Error parsing feed %s: %s", url, err)
-            return []
+            return FeedFetchResult()
 
-    def _parse_entry(self, entry: Any, source_id: int | None = None) -> Article | None:
-        """Parse a single feed entry into an Article.
+    async def _stream_records(
+        self, response: aiohttp.ClientResponse, known_ids: set[str]
+    ) -> tuple[list[dict[str, Any]] | None, list[datetime], bytes]:
+        """Pull raw item records out of a feed body as it is downloaded.
 
         Args:
-            entry: Feed entry from feedparser
-            source_id: Optional source ID
+            response: Response whose body is the feed
+            known_ids: IDs of articles already stored for this feed
 
         Returns:
-            Article object or None if parsing fails
+            Tuple of (records of unknown items, publish times of the skipped
+            known items, body). Records are None when no RSS or Atom items
+            were found, in which case the full body is returned for the
+            fallback parser; otherwise the body is empty.
 
         """
+        parser = etree.XMLPullParser(
+            events=("end",), recover=True, resolve_entities=False, no_network=True
+        )
+        # The body is only kept until the first item proves the format is supported
+        buffered: list[bytes] | None = []
+        records: list[dict[str, Any]] = []
+        known_published: list[datetime] = []
+        known_run = 0
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            if buffered is not None:
+                buffered.append(chunk)
+            parser.feed(chunk)
+
+            for _event, element in parser.read_events():
+                if element.tag not in _ITEM_TAGS:
+                    continue
+
+                record = _element_to_record(element)
+
+                # Free the item and everything before it
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+                if record is None:
+                    continue
+                buffered = None
+
+                if hashlib.md5(record["link"].encode()).hexdigest() in known_ids:
+                    # Still needed by the scheduler to learn the publish cadence
+                    published = _record_published(record)
+                    if published:
+                        known_published.append(published)
+
+                    known_run += 1
+                    if known_run >= STREAM_KNOWN_RUN:
+                        _LOGGER.debug(
+                            "Stopping after %d already seen items", known_run
+                        )
+                        return records, known_published, b""
+                    continue
+
+                known_run = 0
+                records.append(record)
+
+        if buffered is not None:
+            return None, [], b"".join(buffered)
+
+        return records, known_published, b""
+
+
+def _element_to_record(item: etree._Element) -> dict[str, Any] | None:
+    """Extract the raw fields of an RSS <item> or Atom <entry>.
+
+    Args:
+        item: Item element
+
+    Returns:
+        Record with unparsed field values, or None if the item has no link
+
+    """
+    record: dict[str, Any] = {"tags": []}
+    guid = ""
+
+    for child in item:
+        # Comments and processing instructions have no string tag
+        field_name = _FIELD_TAGS.get(child.tag) if isinstance(child.tag, str) else None
+
+        if field_name is None:
+            continue
+        if field_name == "link":
+            href = child.get("href")
+            if href is None:
+                value = (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate":
+                value = href.strip()
+            else:
+                continue
+        elif field_name == "guid":
+            if child.get("isPermaLink", "true") != "false":
+                guid = guid or (child.text or "").strip()
+            continue
+        elif field_name == "category":
+            term = child.get("term") or (child.text or "").strip()
+            if term:
+                record["tags"].append(term)
+            continue
+        elif field_name == "author":
+            value = (child.findtext("{*}name") if len(child) else child.text) or ""
+            value = value.strip()
+        elif field_name == "title":
+            value = "".join(child.itertext()).strip()
+        elif field_name in ("summary", "content"):
+            value = _element_html(child).strip()
+        else:
+            value = (child.text or "").strip()
+
+        # The first non-empty value wins, like feedparser keeps the first
+        if value:
+            record.setdefault(field_name, value)
+
+    record["link"] = record.get("link") or guid
+    if not record["link"]:
+        return None
+
+    return record
+
+
+def _element_html(element: etree._Element) -> str:
+    """Get the markup inside an element, serializing inline XHTML children."""
+    if not len(element):
+        return element.text or ""
+
+    return (element.text or "") + "".join(
+        etree.tostring(child, encoding="unicode", with_tail=True) for child in element
+    )
+
+
+def _parse_record_date(value: str | None) -> time.struct_time | None:
+    """Parse an RFC 822 or ISO 8601 feed date into a UTC time tuple."""
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
         try:
-            # Extract URL (required)
-            url = entry.get("link", "")
-            if not url:
-                _LOGGER.debug("Skipping entry without URL")
-                return None
-
-            # Generate article ID from URL
-            article_id = hashlib.md5(url.encode()).hexdigest()
-
-            # Extract title (required)
-            title = entry.get("title", "").strip()
-            if not title:
-                _LOGGER.debug("Skipping entry without title: %s", url)
-                return None
-
-            # Extract summary/description
-            summary = ""
-            if "summary" in entry:
-                summary = self._clean_html(entry.summary)
-            elif "description" in entry:
-                summary = self._clean_html(entry.description)
-
-            # Extract content
-            content = ""
-            if "content" in entry and entry.content:
-                content = self._clean_html(entry.content[0].value)
-            elif summary:
-                content = summary
-
-            # Extract author
-            author = entry.get("author", "")
-
-            # Extract published date
-            published_at = None
-            if "published_parsed" in entry and entry.published_parsed:
-                try:
-                    published_at = datetime(*entry.published_parsed[:6])
-                except (TypeError, ValueError):
-                    pass
-
-            if not published_at and "updated_parsed" in entry and entry.updated_parsed:
-                try:
-                    published_at = datetime(*entry.updated_parsed[:6])
-                except (TypeError, ValueError):
-                    pass
-
-            # Detect language
-            language = self._detect_language(title + " " + summary)
-
-            # Extract topics/tags
-            topics = []
-            if "tags" in entry:
-                topics = [tag.term for tag in entry.tags if hasattr(tag, "term")]
-
-            # Create article
-            article = Article(
-                id=article_id,
-                source_id=source_id,
-                title=title,
-                summary=summary,
-                content=content,
-                url=url,
-                author=author,
-                published_at=published_at,
-                fetched_at=datetime.now(),
-                language=language,
-                topics=topics,
-                score=0.0,  # Will be calculated later
-            )
-
-            return article
-
-        except Exception as err:
-            _LOGGER.error("Error parsing entry: %s", err)
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
             return None
 
-    def _clean_html(self, html_content: str) -> str:
-        """Clean HTML tags and return plain text.
-
-        Args:
-            html_content: HTML content
-
-        Returns:
-            Plain text
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
 
-        """
-        try:
-            soup = BeautifulSoup(html_content, "lxml")
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            # Get text
-            text = soup.get_text(separator=" ", strip=True)
-            # Clean up whitespace
-            text = " ".join(text.split())
-            return text
-        except Exception as err:
-            _LOGGER.debug("Error cleaning HTML: %s", err)
-            return html_content
+    return parsed.timetuple()
 
-    def _detect_language(self, text: str) -> str:
-        """Detect language of text.
 
-        Args:
-            text: Text to analyze
+def _record_published(record: dict[str, Any]) -> datetime | None:
+    """Get the publish time of a raw record, like _parse_entry does."""
+    parsed = _parse_record_date(record.get("published")) or _parse_record_date(
+        record.get("updated")
+    )
+    return datetime(*parsed[:6]) if parsed else None
+
+
+def parse_feed_records(
+    records: list[dict[str, Any]], source_id: int | None = None
+) -> list[Article]:
+    """Turn raw records from the streaming parser into articles.
+
+    Runs in an executor worker, like parse_feed_content.
+
+    Args:
+        records: Raw item records
+        source_id: Optional source ID
+
+    Returns:
+        List of Article objects
+
+    """
+    articles = []
+    for record in records:
+        entry = feedparser.FeedParserDict(
+            link=record["link"],
+            title=record.get("title", ""),
+            author=record.get("author", ""),
+            published_parsed=_parse_record_date(record.get("published")),
+            updated_parsed=_parse_record_date(record.get("updated")),
+            tags=[feedparser.FeedParserDict(term=term) for term in record["tags"]],
+        )
+        if "summary" in record:
+            entry["summary"] = record["summary"]
+        if record.get("content"):
+            entry["content"] = [feedparser.FeedParserDict(value=record["content"])]
+
+        article = _parse_entry(entry, source_id)
+        if article:
+            articles.append(article)
+
+    return articles
+
+
+def parse_feed_content(
+    content: bytes,
+    url: str,
+    source_id: int | None = None,
+    content_type: str | None = None,
+) -> list[Article]:
+    """Parse raw feed bytes into articles.
+
+    Runs in an executor worker: it only takes and returns picklable values
+    and does all CPU-heavy work (XML parsing, HTML cleaning, language
+    detection, fingerprinting) away from the event loop.
+
+    Args:
+        content: Raw feed body
+        url: Feed URL, used for logging
+        source_id: Optional source ID
+        content_type: HTTP Content-Type of the body, whose charset takes
+            precedence over the encoding declared in the XML
+
+    Returns:
+        List of Article objects
+
+    """
+    feed = feedparser.parse(
+        content,
+        response_headers={"content-type": content_type} if content_type else None,
+    )
+
+    if feed.bozo:
+        _LOGGER.warning("Feed %s has malformed XML: %s", url, feed.bozo_exception)
+
+    articles = []
+    for entry in feed.entries:
+        article = _parse_entry(entry, source_id)
+        if article:
+            articles.append(article)
+
+    return articles
+
+
+def _parse_entry(entry: Any, source_id: int | None = None) -> Article | None:
+    """Parse a single feed entry into an Article.
+
+    Args:
+        entry: Feed entry from feedparser
+        source_id: Optional source ID
+
+    Returns:
+        Article object or None if parsing fails
+
+    """
+    try:
+        # Extract URL (required)
+        url = entry.get("link", "")
+        if not url:
+            _LOGGER.debug("Skipping entry without URL")
+            return None
 
-        Returns:
-            Language code (ISO 639-1)
+        # Generate article ID from URL
+        article_id = hashlib.md5(url.encode()).hexdigest()
 
-        """
-        try:
-            if not text or len(text) < 10:
-                return "en"
+        # Extract title (required)
+        title = entry.get("title", "").strip()
+        if not title:
+            _LOGGER.debug("Skipping entry without title: %s", url)
+            return None
 
-            lang = detect(text)
-            return lang
-        except LangDetectException:
-            return "en"
-        except Exception as err:
-            _LOGGER.debug("Error detecting language: %s", err)
+        # Extract summary/description
+        summary = ""
+        if "summary" in entry:
+            summary = _clean_html(entry.summary)
+        elif "description" in entry:
+            summary = _clean_html(entry.description)
+
+        # Extract content
+        content = ""
+        if "content" in entry and entry.content:
+            content = _clean_html(entry.content[0].value)
+        elif summary:
+            content = summary
+
+        # Extract author
+        author = entry.get("author", "")
+
+        # Extract published date
+        published_at = None
+        if "published_parsed" in entry and entry.published_parsed:
+            try:
+                published_at = datetime(*entry.published_parsed[:6])
+            except (TypeError, ValueError):
+                pass
+
+        if not published_at and "updated_parsed" in entry and entry.updated_parsed:
+            try:
+                published_at = datetime(*entry.updated_parsed[:6])
+            except (TypeError, ValueError):
+                pass
+
+        # Detect language
+        language = _detect_language(title + " " + summary)
+
+        # Extract topics/tags
+        topics = []
+        if "tags" in entry:
+            topics = [tag.term for tag in entry.tags if hasattr(tag, "term")]
+
+        # Create article
+        article = Article(
+            id=article_id,
+            source_id=source_id,
+            title=title,
+            summary=summary,
+            content=content,
+            url=url,
+            author=author,
+            published_at=published_at,
+            fetched_at=datetime.now(),
+            language=language,
+            topics=topics,
+            score=0.0,  # Will be calculated later
+        )
+        article.simhash = article_simhash(article)
+
+        return article
+
+    except Exception as err:
+        _LOGGER.error("Error parsing entry: %s", err)
+        return None
+
+
+def _clean_html(html_content: str) -> str:
+    """Clean HTML tags and return plain text.
+
+    Args:
+        html_content: HTML content
+
+    Returns:
+        Plain text
+
+    """
+    try:
+        soup = BeautifulSoup(html_content, "lxml")
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        # Get text
+        text = soup.get_text(separator=" ", strip=True)
+        # Clean up whitespace
+        text = " ".join(text.split())
+        return text
+    except Exception as err:
+        _LOGGER.debug("Error cleaning HTML: %s", err)
+        return html_content
+
+
+def _detect_language(text: str) -> str:
+    """Detect language of text.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Language code (ISO 639-1)
+
+    """
+    try:
+        if not text or len(text) < 10:
             return "en"
+
+        lang = detect(text)
+        return lang
+    except LangDetectException:
+        return "en"
+    except Exception as err:
+        _LOGGER.debug("Error detecting language: %s", err)
+        return "en"
@@ -0,0 +1,142 @@
+"""Adaptive per-source fetch scheduling for Daily Brief."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from statistics import median
+
+from ..const import (
+    SCHEDULER_CADENCE_SAMPLE,
+    SCHEDULER_MAX_BACKOFF,
+    SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_SMOOTHING,
+    SCHEDULER_UNCHANGED_FACTOR,
+)
+from ..storage.models import ContentSource
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FetchScheduler:
+    """Decide when each source is due for its next fetch.
+
+    Every source keeps a smoothed estimate of its publish cadence, learned
+    from the gaps between item timestamps and stretched whenever a fetch
+    finds nothing new. Busy sources are polled often, quiet sources rarely,
+    and failing sources back off exponentially.
+    """
+
+    def __init__(
+        self,
+        min_interval: int = SCHEDULER_MIN_INTERVAL,
+        max_interval: int = SCHEDULER_MAX_INTERVAL,
+        max_backoff: int = SCHEDULER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            min_interval: Shortest time between fetches in seconds
+            max_interval: Longest time between fetches in seconds
+            max_backoff: Longest error backoff in seconds
+
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+
+    def is_due(self, source: ContentSource, now: datetime | None = None) -> bool:
+        """Check if a source should be fetched now.
+
+        Args:
+            source: Content source
+            now: Reference time (defaults to now)
+
+        Returns:
+            True if the source has never been scheduled or its next fetch time has passed
+
+        """
+        if source.next_fetch is None:
+            return True
+
+        return source.next_fetch <= (now or datetime.now())
+
+    @staticmethod
+    def estimate_cadence(published: list[datetime]) -> float | None:
+        """Estimate the publish cadence of a feed from its item timestamps.
+
+        Args:
+            published: Publish times of the feed's items
+
+        Returns:
+            Median gap between the newest items in seconds, or None if unknown
+
+        """
+        timestamps = sorted(published, reverse=True)[:SCHEDULER_CADENCE_SAMPLE]
+        gaps = [
+            (newer - older).total_seconds()
+            for newer, older in zip(timestamps, timestamps[1:])
+            if newer > older
+        ]
+
+        if not gaps:
+            return None
+
+        return median(gaps)
+
+    def record_success(
+        self,
+        source: ContentSource,
+        published: list[datetime],
+        changed: bool = True,
+        now: datetime | None = None,
+    ) -> None:
+        """Update a source's schedule after a successful fetch.
+
+        Args:
+            source: Content source, updated in place
+            published: Publish times of the fetched items
+            changed: False if the server reported the feed as unchanged
+            now: Reference time (defaults to now)
+
+        """
+        now = now or datetime.now()
+        interval = source.update_interval or float(self.min_interval)
+
+        cadence = self.estimate_cadence(published) if changed else None
+        if cadence is not None:
+            interval = SCHEDULER_SMOOTHING * cadence + (1 - SCHEDULER_SMOOTHING) * interval
+        elif not changed:
+            interval *= SCHEDULER_UNCHANGED_FACTOR
+
+        source.update_interval = min(self.max_interval, max(self.min_interval, interval))
+        source.error_count = 0
+        source.next_fetch = now + timedelta(seconds=source.update_interval)
+
+        _LOGGER.debug(
+            "Source %s: cadence %.0fs, next fetch %s",
+            source.name,
+            source.update_interval,
+            source.next_fetch.isoformat(timespec="seconds"),
+        )
+
+    def record_failure(self, source: ContentSource, now: datetime | None = None) -> None:
+        """Back off a source exponentially after a failed fetch.
+
+        Args:
+            source: Content source, updated in place
+            now: Reference time (defaults to now)
+
+        """
+        now = now or datetime.now()
+        source.error_count += 1
+
+        backoff = min(self.max_backoff, self.min_interval * 2 ** source.error_count)
+        source.next_fetch = now + timedelta(seconds=backoff)
+
+        _LOGGER.debug(
+            "Source %s failed %d times, retrying at %s",
+            source.name,
+            source.error_count,
+            source.next_fetch.isoformat(timespec="seconds"),
+        )
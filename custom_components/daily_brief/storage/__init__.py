@@ -1,12 +1,24 @@
 """Storage module for Daily Brief."""
-from .cache import Cache
+from .cache import Cache, DiskCache
 from .database import Database
-from .models import Article, Briefing, ContentSource, Feedback, UserConfig, UserProfile
+from .models import (
+    Article,
+    ArticleBatch,
+    ArticleDigest,
+    Briefing,
+    ContentSource,
+    Feedback,
+    UserConfig,
+    UserProfile,
+)
 
 __all__ = [
     "Cache",
+    "DiskCache",
     "Database",
     "Article",
+    "ArticleBatch",
+    "ArticleDigest",
     "Briefing",
     "ContentSource",
     "Feedback",
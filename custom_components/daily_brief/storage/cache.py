@@ -4,7 +4,12 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
@@ -124,3 +129,164 @@ class Cache:
             "valid_entries": valid_entries,
             "expired_entries": expired_entries,
         }
+
+
+class DiskCache:
+    """Content-addressed file cache with a size budget and LRU eviction.
+
+    Each value is stored in its own file named after the SHA-256 of the key
+    arguments. The access order is kept in file modification times, so the
+    least recently used entries are still evicted first after a restart.
+    Methods do blocking file I/O and are safe to call from executor threads.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, suffix: str = "") -> None:
+        """Initialize cache.
+
+        Args:
+            directory: Directory holding the cache files
+            max_bytes: Total size budget; least recently used entries are
+                evicted beyond it
+            suffix: File name suffix for the entries
+
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._suffix = suffix
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] | None = None  # key -> size, LRU first
+        self._total_bytes = 0
+
+    def _generate_key(self, *args: Any) -> str:
+        """Generate cache key from arguments."""
+        key_str = json.dumps(args, ensure_ascii=False, default=str)
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the file path of an entry."""
+        return self._directory / f"{key}{self._suffix}"
+
+    def _load(self) -> OrderedDict[str, int]:
+        """Index the existing entries by access time on first use."""
+        if self._entries is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            found = []
+            for path in self._directory.glob(f"*{self._suffix}"):
+                key = path.name.removesuffix(self._suffix)
+                if len(key) != 64:  # Leftover temporary file
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, key, stat.st_size))
+
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._total_bytes = sum(self._entries.values())
+
+        return self._entries
+
+    def get(self, *args: Any) -> bytes | None:
+        """Get value from cache.
+
+        Args:
+            *args: Arguments to generate cache key
+
+        Returns:
+            Cached bytes or None if not found
+
+        """
+        key = self._generate_key(*args)
+        path = self._path(key)
+
+        with self._lock:
+            entries = self._load()
+            if key not in entries:
+                return None
+
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                self._total_bytes -= entries.pop(key)
+                return None
+
+            entries.move_to_end(key)
+
+        return data
+
+    def set(self, *args: Any, value: bytes) -> None:
+        """Set value in cache.
+
+        Args:
+            *args: Arguments to generate cache key
+            value: Bytes to cache
+
+        """
+        if len(value) > self._max_bytes:
+            return
+
+        key = self._generate_key(*args)
+
+        with self._lock:
+            entries = self._load()
+
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(value)
+                os.replace(tmp_path, self._path(key))
+            except OSError as err:
+                _LOGGER.warning("Failed to write cache entry %s: %s", key, err)
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                return
+
+            self._total_bytes += len(value) - entries.pop(key, 0)
+            entries[key] = len(value)
+            self._evict(entries)
+
+    def _evict(self, entries: OrderedDict[str, int]) -> None:
+        """Remove least recently used entries until within the size budget."""
+        evicted = 0
+        while self._total_bytes > self._max_bytes and entries:
+            key, size = entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+            evicted += 1
+
+        if evicted:
+            _LOGGER.debug("Evicted %d disk cache entries", evicted)
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            entries = self._load()
+            for key in entries:
+                self._path(key).unlink(missing_ok=True)
+            entries.clear()
+            self._total_bytes = 0
+
+        _LOGGER.debug("Disk cache cleared")
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache stats
+
+        """
+        with self._lock:
+            entries = self._load()
+            return {
+                "total_entries": len(entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+            }
@@ -2,19 +2,229 @@
 from __future__ import annotations
 
 import aiosqlite
+import asyncio
+import calendar
 import json
 import logging
-from datetime import datetime
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from sys import intern
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from homeassistant.core import HomeAssistant
 
-from ..const import DATABASE_NAME, STORAGE_DIR
-from .models import Article, Briefing, ContentSource, Feedback, UserConfig, UserProfile
+from ..const import (
+    DATABASE_NAME,
+    DATABASE_PRAGMAS,
+    DATABASE_READ_CONNECTIONS,
+    STORAGE_DIR,
+)
+from .index import fts_query, fts_text
+from .models import (
+    Article,
+    ArticleDigest,
+    Briefing,
+    ContentSource,
+    Feedback,
+    UserConfig,
+    UserProfile,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_UINT64_MASK = (1 << 64) - 1
+
+_ARTICLE_COLUMN_NAMES = (
+    "id",
+    "source_id",
+    "title",
+    "summary",
+    "content",
+    "url",
+    "author",
+    "published_at",
+    "fetched_at",
+    "language",
+    "topics",
+    "score",
+    "simhash",
+)
+_ARTICLE_COLUMNS = ", ".join(_ARTICLE_COLUMN_NAMES)
+# Derived from the text when saving, so selection and search never read it
+_ARTICLE_DERIVED_COLUMN_NAMES = ("content_length", "word_count")
+_ARTICLE_WRITE_COLUMN_NAMES = _ARTICLE_COLUMN_NAMES + _ARTICLE_DERIVED_COLUMN_NAMES
+_ARTICLE_WRITE_COLUMNS = ", ".join(_ARTICLE_WRITE_COLUMN_NAMES)
+_ARTICLE_WRITE_PLACEHOLDERS = ", ".join("?" for _ in _ARTICLE_WRITE_COLUMN_NAMES)
+_ARTICLE_DIGEST_COLUMN_NAMES = tuple(
+    column
+    for column in _ARTICLE_WRITE_COLUMN_NAMES
+    if column not in ("content", "simhash")
+)
+_ARTICLE_DIGEST_COLUMNS = ", ".join(_ARTICLE_DIGEST_COLUMN_NAMES)
+# FTS5 column weights for title, summary and topics in bm25()
+_FTS_WEIGHTS = "2.0, 1.0, 1.5"
+# A re-fetched article only counts as changed if one of these differs
+_ARTICLE_CHANGE_COLUMNS = tuple(
+    column for column in _ARTICLE_COLUMN_NAMES if column not in ("id", "fetched_at")
+)
+_ARTICLE_UPSERT_SQL = (
+    f"INSERT INTO articles ({_ARTICLE_WRITE_COLUMNS}) VALUES ({_ARTICLE_WRITE_PLACEHOLDERS}) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(
+        f"{column} = excluded.{column}" for column in _ARTICLE_WRITE_COLUMN_NAMES[1:]
+    )
+)
+
+
+_EPOCH = datetime(1970, 1, 1)
+# Separator for the topics column; cannot appear in a topic name
+_TOPIC_SEPARATOR = "\x1f"
+
+
+def _to_epoch(value: datetime | None) -> int | None:
+    """Encode a datetime as integer seconds since the epoch.
+
+    Naive datetimes are stored by their wall-clock value, like SQLite's own
+    ``strftime('%s', ...)`` does, so they decode to the same naive value.
+    """
+    if value is None:
+        return None
+    return calendar.timegm(value.utctimetuple())
+
+
+def _from_epoch(value: int | None) -> datetime | None:
+    """Decode integer seconds since the epoch to a naive datetime."""
+    if value is None:
+        return None
+    return _epoch_datetime(value)
+
+
+@lru_cache(maxsize=4096)
+def _epoch_datetime(value: int) -> datetime:
+    """Decode an epoch value, sharing the result between rows.
+
+    Articles saved in one ingest run mostly carry the same fetch second, so
+    the cache turns most timestamp decodes into a dictionary hit.
+    """
+    return _EPOCH + timedelta(seconds=value)
+
+
+def _split_topics(value: str | None) -> list[str]:
+    """Decode a topics column, sharing one string object per distinct topic."""
+    return [intern(topic) for topic in value.split(_TOPIC_SEPARATOR)] if value else []
+
+
+def _to_signed64(value: int) -> int:
+    """Map an unsigned 64-bit value onto SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _from_signed64(value: int | None) -> int:
+    """Map a stored signed INTEGER back to an unsigned 64-bit value."""
+    return (value or 0) & _UINT64_MASK
+
+
+def _article_size(content: str | None, summary: str | None) -> tuple[int, int]:
+    """Get the content length and word count stored alongside an article."""
+    return len(content or ""), len((content or summary or "").split())
+
+
+def _article_params(article: Article) -> tuple[Any, ...]:
+    """Get the articles row values of an article, in _ARTICLE_WRITE_COLUMN_NAMES order."""
+    return (
+        article.id,
+        article.source_id,
+        article.title,
+        article.summary,
+        article.content,
+        article.url,
+        article.author,
+        _to_epoch(article.published_at),
+        _to_epoch(article.fetched_at),
+        article.language,
+        _TOPIC_SEPARATOR.join(article.topics),
+        article.score,
+        _to_signed64(article.simhash),
+        *_article_size(article.content, article.summary),
+    )
+
+
+def _row_to_article(row: tuple[Any, ...]) -> Article:
+    """Build an article from a plain tuple row in _ARTICLE_COLUMNS order.
+
+    Tuple rows skip the per-column name lookups of ``aiosqlite.Row``, and
+    epoch timestamps and joined topics decode without any parsing.
+    """
+    (
+        article_id,
+        source_id,
+        title,
+        summary,
+        content,
+        url,
+        author,
+        published_at,
+        fetched_at,
+        language,
+        topics,
+        score,
+        simhash,
+    ) = row
+
+    return Article(
+        id=article_id,
+        source_id=source_id,
+        title=title,
+        summary=summary,
+        content=content,
+        url=url,
+        author=author,
+        published_at=_from_epoch(published_at),
+        fetched_at=_from_epoch(fetched_at),
+        language=intern(language) if language else language,
+        topics=_split_topics(topics),
+        score=score,
+        simhash=simhash & _UINT64_MASK if simhash else 0,
+    )
+
+
+def _row_to_digest(row: tuple[Any, ...]) -> ArticleDigest:
+    """Build an article digest from a plain tuple row in _ARTICLE_DIGEST_COLUMNS order."""
+    (
+        article_id,
+        source_id,
+        title,
+        summary,
+        url,
+        author,
+        published_at,
+        fetched_at,
+        language,
+        topics,
+        score,
+        content_length,
+        word_count,
+    ) = row
+
+    return ArticleDigest(
+        id=article_id,
+        source_id=source_id,
+        title=title,
+        summary=summary,
+        url=url,
+        author=author,
+        published_at=_from_epoch(published_at),
+        fetched_at=_from_epoch(fetched_at),
+        language=intern(language) if language else language,
+        topics=_split_topics(topics),
+        score=score,
+        content_length=content_length or 0,
+        word_count=word_count or 0,
+    )
+
 
 class Database:
     """Database manager for Daily Brief."""
@@ -23,25 +233,103 @@ class Database:
         """Initialize database."""
         self.hass = hass
         self._db_path = Path(hass.config.path(STORAGE_DIR)) / DATABASE_NAME
+        # All writes go through one connection, reads are spread over a pool
         self._connection: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        # False if SQLite was built without FTS5
+        self._fts_available = False
+
+    @property
+    def fts_available(self) -> bool:
+        """Return True if the full-text search index is available."""
+        return self._fts_available
 
     async def async_initialize(self) -> None:
-        """Initialize database connection and create tables."""
+        """Initialize database connections and create tables."""
         _LOGGER.debug("Initializing database at %s", self._db_path)
 
-        self._connection = await aiosqlite.connect(str(self._db_path))
-        self._connection.row_factory = aiosqlite.Row
+        self._connection = await self._connect()
+        # WAL lets readers run while the writer commits; the mode is
+        # stored in the database file, so it only has to be set once
+        await self._connection.execute("PRAGMA journal_mode = WAL")
 
         await self._create_tables()
+
+        # Retried on every open, as the SQLite library may have gained FTS5
+        # since the migration ran
+        self._fts_available = await self._create_full_text_index()
+        await self._connection.commit()
+
+        for _ in range(DATABASE_READ_CONNECTIONS):
+            reader = await self._connect()
+            await reader.execute("PRAGMA query_only = ON")
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
         _LOGGER.info("Database initialized successfully")
 
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a connection with the tuned pragmas."""
+        connection = await aiosqlite.connect(str(self._db_path))
+        connection.row_factory = aiosqlite.Row
+
+        for pragma, value in DATABASE_PRAGMAS.items():
+            await connection.execute(f"PRAGMA {pragma} = {value}")
+
+        return connection
+
     async def async_close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
+        for reader in self._readers:
+            await reader.close()
+        self._readers.clear()
+        self._idle_readers = asyncio.Queue()
+
         if self._connection:
             await self._connection.close()
             self._connection = None
             _LOGGER.debug("Database connection closed")
 
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read connection, or the writer if there is no read pool."""
+        if not self._readers:
+            assert self._connection is not None
+            yield self._connection
+            return
+
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    async def _fetchall(
+        self, query: str, params: tuple[Any, ...] = ()
+    ) -> list[aiosqlite.Row]:
+        """Run a read-only query and return all rows."""
+        async with self._read_connection() as connection:
+            cursor = await connection.execute(query, params)
+            return list(await cursor.fetchall())
+
+    async def _fetchall_tuples(
+        self, query: str, params: tuple[Any, ...] = ()
+    ) -> list[tuple[Any, ...]]:
+        """Run a read-only query and return all rows as plain tuples."""
+        async with self._read_connection() as connection:
+            cursor = await connection.execute(query, params)
+            cursor.row_factory = None
+            return await cursor.fetchall()
+
+    async def _fetchone(
+        self, query: str, params: tuple[Any, ...] = ()
+    ) -> aiosqlite.Row | None:
+        """Run a read-only query and return the first row."""
+        async with self._read_connection() as connection:
+            cursor = await connection.execute(query, params)
+            return await cursor.fetchone()
+
     async def _create_tables(self) -> None:
         """Create database tables."""
         if not self._connection:
@@ -144,23 +432,233 @@ class Database:
         await self._connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_articles_score ON articles(score DESC)"
         )
-        await self._connection.execute(
-            "CREATE INDEX IF NOT EXISTS idx_briefings_date ON briefings(date DESC)"
-        )
         await self._connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON feedback(timestamp DESC)"
         )
 
         await self._connection.commit()
 
+        await self._migrate()
+
+    async def _migrate(self) -> None:
+        """Upgrade the schema to the latest version.
+
+        The schema version is kept in ``PRAGMA user_version``. Every pending
+        migration runs in its own transaction together with the version bump,
+        so an interrupted upgrade resumes at the step that failed.
+        """
+        if not self._connection:
+            return
+
+        cursor = await self._connection.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        version = row[0] if row else 0
+
+        migrations = self._migrations()
+        if version > len(migrations):
+            _LOGGER.warning(
+                "Database schema version %d is newer than supported version %d",
+                version,
+                len(migrations),
+            )
+            return
+
+        for target, migration in enumerate(migrations[version:], start=version + 1):
+            await self._connection.execute("BEGIN")
+            try:
+                await migration()
+                await self._connection.execute(f"PRAGMA user_version = {target}")
+            except Exception:
+                await self._connection.rollback()
+                raise
+            await self._connection.commit()
+            _LOGGER.info("Migrated database schema to version %d", target)
+
+    def _migrations(self) -> list[Callable[[], Awaitable[None]]]:
+        """Return the schema upgrade steps in order.
+
+        Steps are only ever appended; the position of a step is the schema
+        version it produces.
+        """
+        return [
+            self._migrate_fetch_state,
+            self._migrate_query_indexes,
+            self._migrate_compact_articles,
+            self._migrate_article_sizes,
+            self._migrate_full_text_search,
+            self._migrate_source_timestamps,
+        ]
+
+    async def _migrate_fetch_state(self) -> None:
+        """Version 1: conditional GET validators, scheduling and fingerprints."""
+        await self._add_column_if_missing("sources", "etag", "TEXT")
+        await self._add_column_if_missing("sources", "last_modified", "TEXT")
+        await self._add_column_if_missing("sources", "pack_id", "TEXT")
+        await self._add_column_if_missing("sources", "update_interval", "REAL")
+        await self._add_column_if_missing("sources", "next_fetch", "TIMESTAMP")
+        await self._add_column_if_missing("articles", "simhash", "INTEGER DEFAULT 0")
+
+    async def _migrate_query_indexes(self) -> None:
+        """Version 2: indexes for cleanup, URL, per-source and briefing lookups."""
+        # Serves the recent fingerprint scan as well as the cleanup range delete
+        await self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_fetched ON articles(fetched_at)"
+        )
+        await self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)"
+        )
+        await self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source_id, id)"
+        )
+        await self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_briefings_date_type "
+            "ON briefings(date, type, generated_at DESC)"
+        )
+        # Superseded by the leading column of idx_briefings_date_type
+        await self._connection.execute("DROP INDEX IF EXISTS idx_briefings_date")
+
+    async def _migrate_compact_articles(self) -> None:
+        """Version 3: epoch timestamps and separator-joined topics for articles."""
+        for column in ("published_at", "fetched_at"):
+            await self._connection.execute(
+                f"UPDATE articles SET {column} = CAST(strftime('%s', {column}) AS INTEGER) "
+                f"WHERE typeof({column}) = 'text'"
+            )
+        await self._connection.execute(
+            """
+            UPDATE articles SET topics = COALESCE(
+                (SELECT group_concat(value, char(31)) FROM json_each(articles.topics)), ''
+            )
+            WHERE json_valid(topics) AND json_type(topics) = 'array'
+            """
+        )
+
+    async def _migrate_article_sizes(self) -> None:
+        """Version 4: body length and word count columns for article digests."""
+        await self._add_column_if_missing("articles", "content_length", "INTEGER DEFAULT 0")
+        await self._add_column_if_missing("articles", "word_count", "INTEGER DEFAULT 0")
+
+        cursor = await self._connection.execute("SELECT id, content, summary FROM articles")
+        rows = await cursor.fetchall()
+        await self._connection.executemany(
+            "UPDATE articles SET content_length = ?, word_count = ? WHERE id = ?",
+            [(*_article_size(row[1], row[2]), row[0]) for row in rows],
+        )
+
+    async def _migrate_full_text_search(self) -> None:
+        """Version 5: stable article rowids and an FTS5 table over their text.
+
+        The articles table is rebuilt with an ``INTEGER PRIMARY KEY`` alias,
+        seq, so that VACUUM cannot renumber the rows the index points at.
+        """
+        cursor = await self._connection.execute(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'articles' AND sql IS NOT NULL"
+        )
+        indexes = [row[0] for row in await cursor.fetchall()]
+
+        await self._connection.execute(
+            """
+            CREATE TABLE articles_new (
+                seq INTEGER PRIMARY KEY,
+                id TEXT NOT NULL UNIQUE,
+                source_id INTEGER,
+                title TEXT NOT NULL,
+                summary TEXT,
+                content TEXT,
+                url TEXT NOT NULL,
+                author TEXT,
+                published_at TIMESTAMP,
+                fetched_at TIMESTAMP,
+                language TEXT,
+                topics TEXT,
+                score REAL DEFAULT 0,
+                simhash INTEGER DEFAULT 0,
+                content_length INTEGER DEFAULT 0,
+                word_count INTEGER DEFAULT 0,
+                FOREIGN KEY (source_id) REFERENCES sources(id)
+            )
+            """
+        )
+        await self._connection.execute(
+            f"INSERT INTO articles_new ({_ARTICLE_WRITE_COLUMNS}) "
+            f"SELECT {_ARTICLE_WRITE_COLUMNS} FROM articles"
+        )
+        await self._connection.execute("DROP TABLE articles")
+        await self._connection.execute("ALTER TABLE articles_new RENAME TO articles")
+        for index in indexes:
+            await self._connection.execute(index)
+
+        await self._create_full_text_index()
+
+    async def _migrate_source_timestamps(self) -> None:
+        """Version 6: epoch timestamps for source fetch times, like articles."""
+        for column in ("last_fetched", "next_fetch"):
+            await self._connection.execute(
+                f"UPDATE sources SET {column} = CAST(strftime('%s', {column}) AS INTEGER) "
+                f"WHERE typeof({column}) = 'text'"
+            )
+
+    async def _create_full_text_index(self) -> bool:
+        """Create and fill the FTS5 table over article titles, summaries and topics.
+
+        The index holds the text that fts_text() produces, which splits CJK
+        text into single characters. It is written from Python when articles
+        are saved or cleaned up, so plain SQLite clients can still write to
+        the articles table.
+
+        Returns:
+            True if the table exists, False if SQLite has no FTS5 module
+
+        """
+        cursor = await self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        )
+        if await cursor.fetchone() is not None:
+            return True
+
+        try:
+            await self._connection.execute(
+                "CREATE VIRTUAL TABLE articles_fts USING fts5("
+                "title, summary, topics, tokenize='unicode61')"
+            )
+        except sqlite3.OperationalError as err:
+            _LOGGER.warning("Full-text search is not available: %s", err)
+            return False
+
+        cursor = await self._connection.execute(
+            "SELECT seq, title, summary, topics FROM articles"
+        )
+        await self._connection.executemany(
+            "INSERT INTO articles_fts (rowid, title, summary, topics) VALUES (?, ?, ?, ?)",
+            [(row[0], *map(fts_text, row[1:])) for row in await cursor.fetchall()],
+        )
+        _LOGGER.info("Created the full-text search index")
+        return True
+
+    async def _add_column_if_missing(
+        self, table: str, column: str, definition: str
+    ) -> None:
+        """Add a column to a table created by an older version."""
+        if not self._connection:
+            return
+
+        cursor = await self._connection.execute(f"PRAGMA table_info({table})")
+        columns = {row["name"] for row in await cursor.fetchall()}
+
+        if column not in columns:
+            await self._connection.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+            )
+            _LOGGER.debug("Added column %s.%s", table, column)
+
     # Config operations
     async def get_config(self) -> dict[str, Any] | None:
         """Get user configuration."""
         if not self._connection:
             return None
 
-        cursor = await self._connection.execute("SELECT * FROM config LIMIT 1")
-        row = await cursor.fetchone()
+        row = await self._fetchone("SELECT * FROM config LIMIT 1")
 
         if not row:
             return None
@@ -220,49 +718,148 @@ class Database:
         await self._connection.commit()
         return cursor.lastrowid or -1
 
-    async def get_sources(self, enabled_only: bool = True) -> list[ContentSource]:
-        """Get all content sources."""
+    async def get_sources(
+        self, enabled_only: bool = True, include_packs: bool = False
+    ) -> list[ContentSource]:
+        """Get all content sources.
+
+        Args:
+            enabled_only: Only return enabled sources
+            include_packs: Also return sources registered for content packs
+                and configured custom feeds
+
+        Returns:
+            List of content sources
+
+        """
         if not self._connection:
             return []
 
-        query = "SELECT * FROM sources"
+        conditions = []
         if enabled_only:
-            query += " WHERE enabled = 1"
+            conditions.append("enabled = 1")
+        if not include_packs:
+            conditions.append("pack_id IS NULL")
 
-        cursor = await self._connection.execute(query)
-        rows = await cursor.fetchall()
+        query = "SELECT * FROM sources"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
 
-        sources = []
-        for row in rows:
-            sources.append(
-                ContentSource(
-                    id=row["id"],
-                    name=row["name"],
-                    url=row["url"],
-                    type=row["type"],
-                    category=row["category"],
-                    language=row["language"],
-                    enabled=bool(row["enabled"]),
-                    weight=row["weight"],
-                    last_fetched=datetime.fromisoformat(row["last_fetched"])
-                    if row["last_fetched"]
-                    else None,
-                    error_count=row["error_count"],
+        rows = await self._fetchall(query)
+
+        return [self._row_to_source(row) for row in rows]
+
+    async def get_or_create_sources(
+        self, sources: list[ContentSource]
+    ) -> list[ContentSource]:
+        """Get the stored rows for sources, registering missing ones.
+
+        All new sources are inserted in one transaction.
+
+        Args:
+            sources: Sources from content packs or the integration config
+
+        Returns:
+            Stored sources in input order, including their IDs and fetch state
+
+        """
+        if not self._connection or not sources:
+            return sources
+
+        await self._connection.executemany(
+            """
+            INSERT OR IGNORE INTO sources
+            (name, url, type, category, language, enabled, weight, pack_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    source.name,
+                    source.url,
+                    source.type,
+                    source.category,
+                    source.language,
+                    source.enabled,
+                    source.weight,
+                    source.pack_id,
                 )
-            )
+                for source in sources
+            ],
+        )
+        await self._connection.commit()
+
+        urls = [source.url for source in sources]
+        cursor = await self._connection.execute(
+            f"SELECT * FROM sources WHERE url IN ({', '.join('?' * len(urls))})",
+            urls,
+        )
+        stored = {row["url"]: self._row_to_source(row) for row in await cursor.fetchall()}
+
+        return [stored.get(source.url, source) for source in sources]
+
+    @staticmethod
+    def _row_to_source(row: aiosqlite.Row) -> ContentSource:
+        """Build a ContentSource from a sources row."""
+        return ContentSource(
+            id=row["id"],
+            name=row["name"],
+            url=row["url"],
+            type=row["type"],
+            category=row["category"],
+            language=row["language"],
+            enabled=bool(row["enabled"]),
+            weight=row["weight"],
+            last_fetched=_from_epoch(row["last_fetched"]),
+            error_count=row["error_count"],
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            pack_id=row["pack_id"],
+            update_interval=row["update_interval"],
+            next_fetch=_from_epoch(row["next_fetch"]),
+        )
+
+    async def save_source_states(self, sources: list[ContentSource]) -> None:
+        """Save the fetch state of sources in one transaction.
+
+        Writes the last fetch time, schedule, error count and HTTP cache
+        validators of every source.
 
-        return sources
+        Args:
+            sources: Sources with an ID
 
-    async def update_source_fetch_time(self, source_id: int) -> None:
-        """Update source last fetch time."""
+        """
         if not self._connection:
             return
 
-        await self._connection.execute(
-            "UPDATE sources SET last_fetched = CURRENT_TIMESTAMP WHERE id = ?",
-            (source_id,),
-        )
-        await self._connection.commit()
+        rows = [
+            (
+                _to_epoch(source.last_fetched),
+                source.update_interval,
+                _to_epoch(source.next_fetch),
+                source.error_count,
+                source.etag,
+                source.last_modified,
+                source.id,
+            )
+            for source in sources
+            if source.id
+        ]
+        if not rows:
+            return
+
+        try:
+            await self._connection.executemany(
+                """
+                UPDATE sources SET last_fetched = ?, update_interval = ?,
+                    next_fetch = ?, error_count = ?, etag = ?, last_modified = ?
+                WHERE id = ?
+                """,
+                rows,
+            )
+            await self._connection.commit()
+        except Exception:
+            await self._connection.rollback()
+            raise
 
     # Article operations
     async def save_article(self, article: Article) -> None:
@@ -270,71 +867,271 @@ class Database:
         if not self._connection:
             return
 
-        await self._connection.execute(
-            """
-            INSERT OR REPLACE INTO articles
-            (id, source_id, title, summary, content, url, author, published_at,
-             fetched_at, language, topics, score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                article.id,
-                article.source_id,
-                article.title,
-                article.summary,
-                article.content,
-                article.url,
-                article.author,
-                article.published_at,
-                article.fetched_at,
-                article.language,
-                json.dumps(article.topics),
-                article.score,
-            ),
-        )
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete
+        # would give the row a new seq and orphan its full-text index row
+        await self._connection.execute(_ARTICLE_UPSERT_SQL, _article_params(article))
+        await self._index_articles([article])
         await self._connection.commit()
 
+    async def save_articles_bulk(
+        self,
+        articles: list[Article],
+        skip_unchanged: bool = True,
+        batch_size: int = 500,
+    ) -> None:
+        """Save many articles in a single transaction.
+
+        Rows are upserted in place instead of being deleted and reinserted
+        like ``INSERT OR REPLACE`` does.
+
+        Args:
+            articles: Articles to save
+            skip_unchanged: Leave existing rows alone when only fetched_at differs
+            batch_size: Number of rows per executemany call
+
+        """
+        if not self._connection or not articles:
+            return
+
+        query = _ARTICLE_UPSERT_SQL
+        if skip_unchanged:
+            query += " WHERE " + " OR ".join(
+                f"{column} IS NOT excluded.{column}" for column in _ARTICLE_CHANGE_COLUMNS
+            )
+
+        try:
+            for start in range(0, len(articles), batch_size):
+                batch = articles[start : start + batch_size]
+                await self._connection.executemany(
+                    query, [_article_params(article) for article in batch]
+                )
+                await self._index_articles(batch)
+            await self._connection.commit()
+        except Exception:
+            await self._connection.rollback()
+            raise
+
+        _LOGGER.debug("Saved %d articles", len(articles))
+
+    async def _index_articles(self, articles: list[Article]) -> None:
+        """Replace the full-text index rows of saved articles.
+
+        Runs in the caller's transaction.
+
+        Args:
+            articles: Articles that were just upserted
+
+        """
+        if not self._fts_available:
+            return
+
+        await self._connection.executemany(
+            "INSERT OR REPLACE INTO articles_fts (rowid, title, summary, topics) "
+            "SELECT seq, ?, ?, ? FROM articles WHERE id = ?",
+            [
+                (
+                    fts_text(article.title),
+                    fts_text(article.summary),
+                    fts_text(" ".join(article.topics)),
+                    article.id,
+                )
+                for article in articles
+            ],
+        )
+
     async def get_articles(
-        self, limit: int | None = None, min_score: float = 0.0
+        self,
+        limit: int | None = None,
+        min_score: float = 0.0,
+        source_id: int | None = None,
+        since: datetime | None = None,
     ) -> list[Article]:
-        """Get articles, optionally filtered by score."""
+        """Get articles, optionally filtered by score, source and fetch time."""
         if not self._connection:
             return []
 
-        query = "SELECT * FROM articles WHERE score >= ? ORDER BY score DESC, published_at DESC"
+        filters, params = self._article_filters(limit, min_score, source_id, since)
+        rows = await self._fetchall_tuples(
+            f"SELECT {_ARTICLE_COLUMNS} FROM articles {filters}", params
+        )
+
+        return [_row_to_article(row) for row in rows]
+
+    async def get_article_digests(
+        self,
+        limit: int | None = None,
+        min_score: float = 0.0,
+        source_id: int | None = None,
+        since: datetime | None = None,
+    ) -> list[ArticleDigest]:
+        """Get article digests, filtered like get_articles, without reading bodies."""
+        if not self._connection:
+            return []
+
+        filters, params = self._article_filters(limit, min_score, source_id, since)
+        rows = await self._fetchall_tuples(
+            f"SELECT {_ARTICLE_DIGEST_COLUMNS} FROM articles {filters}", params
+        )
+
+        return [_row_to_digest(row) for row in rows]
+
+    async def get_candidate_digests(
+        self,
+        queries: list[str],
+        excluded_topics: list[str] | None = None,
+        since: datetime | None = None,
+        limit: int = 200,
+    ) -> list[ArticleDigest]:
+        """Get the articles matching any query, ranked by full-text relevance.
+
+        Matching, exclusion, the freshness window, ranking and the limit all
+        run in a single FTS5 query, so only the candidates are decoded.
+
+        Args:
+            queries: Phrases such as interests; all articles match if empty
+            excluded_topics: Phrases that rule an article out (defaults to the
+                excluded topics of the stored config)
+            since: Only return articles fetched after this time
+            limit: Maximum number of digests to return
+
+        Returns:
+            Matching digests, best bm25 rank first with the rank as their
+            relevance, or by score if there are no queries; empty if
+            full-text search is not available
+
+        """
+        if not self._connection or not self._fts_available:
+            return []
+
+        if excluded_topics is None:
+            config = await self.get_config()
+            excluded_topics = config["excluded_topics"] if config else []
+
+        match = fts_query(queries)
+        exclude = fts_query(excluded_topics)
+        columns = ", ".join(f"a.{column}" for column in _ARTICLE_DIGEST_COLUMN_NAMES)
+
+        conditions: list[str] = []
+        params: tuple[Any, ...] = ()
+
+        if match:
+            # bm25() is negative, more so for better matches
+            columns += f", -bm25(articles_fts, {_FTS_WEIGHTS}) AS relevance"
+            source = "articles_fts JOIN articles a ON a.seq = articles_fts.rowid"
+            conditions.append("articles_fts MATCH ?")
+            params = (*params, match)
+            order = "relevance DESC"
+        else:
+            columns += ", 0.0"
+            source = "articles a"
+            order = "a.score DESC, a.published_at DESC"
+
+        if exclude:
+            conditions.append(
+                "a.seq NOT IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)"
+            )
+            params = (*params, exclude)
+
+        if since is not None:
+            conditions.append("a.fetched_at >= ?")
+            params = (*params, _to_epoch(since))
+
+        query = f"SELECT {columns} FROM {source}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order} LIMIT ?"
+
+        rows = await self._fetchall_tuples(query, (*params, limit))
+
+        digests = []
+        for row in rows:
+            digest = _row_to_digest(row[:-1])
+            digest.relevance = row[-1]
+            digests.append(digest)
+
+        return digests
+
+    async def get_articles_by_ids(self, article_ids: list[str]) -> list[Article]:
+        """Get full articles by ID.
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            Stored articles in the order of the given IDs; unknown IDs are skipped
+
+        """
+        if not self._connection or not article_ids:
+            return []
+
+        placeholders = ", ".join("?" for _ in article_ids)
+        rows = await self._fetchall_tuples(
+            f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE id IN ({placeholders})",
+            tuple(article_ids),
+        )
+
+        articles = {article.id: article for article in map(_row_to_article, rows)}
+        return [articles[article_id] for article_id in article_ids if article_id in articles]
+
+    @staticmethod
+    def _article_filters(
+        limit: int | None,
+        min_score: float,
+        source_id: int | None,
+        since: datetime | None,
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Build the WHERE, ORDER BY and LIMIT clauses shared by article queries."""
+        query = "WHERE score >= ?"
         params: tuple[Any, ...] = (min_score,)
 
+        if source_id is not None:
+            query += " AND source_id = ?"
+            params = (*params, source_id)
+
+        if since is not None:
+            query += " AND fetched_at >= ?"
+            params = (*params, _to_epoch(since))
+
+        query += " ORDER BY score DESC, published_at DESC"
+
         if limit:
             query += " LIMIT ?"
             params = (*params, limit)
 
-        cursor = await self._connection.execute(query, params)
-        rows = await cursor.fetchall()
+        return query, params
 
-        articles = []
-        for row in rows:
-            articles.append(
-                Article(
-                    id=row["id"],
-                    source_id=row["source_id"],
-                    title=row["title"],
-                    summary=row["summary"],
-                    content=row["content"],
-                    url=row["url"],
-                    author=row["author"],
-                    published_at=datetime.fromisoformat(row["published_at"])
-                    if row["published_at"]
-                    else None,
-                    fetched_at=datetime.fromisoformat(row["fetched_at"])
-                    if row["fetched_at"]
-                    else None,
-                    language=row["language"],
-                    topics=json.loads(row["topics"]) if row["topics"] else [],
-                    score=row["score"],
-                )
-            )
+    async def get_article_ids(self, source_id: int) -> set[str]:
+        """Get the IDs of all stored articles from a source."""
+        if not self._connection:
+            return set()
+
+        rows = await self._fetchall(
+            "SELECT id FROM articles WHERE source_id = ?", (source_id,)
+        )
+
+        return {row["id"] for row in rows}
+
+    async def get_recent_fingerprints(self, days: int) -> dict[str, tuple[int, str]]:
+        """Get SimHash fingerprints and titles of recently fetched articles.
+
+        Args:
+            days: Number of days to look back
 
-        return articles
+        Returns:
+            Fingerprint and title keyed by article ID
+
+        """
+        if not self._connection:
+            return {}
+
+        rows = await self._fetchall(
+            "SELECT id, simhash, title FROM articles WHERE fetched_at >= ?",
+            (_to_epoch(datetime.now() - timedelta(days=days)),),
+        )
+
+        return {
+            row["id"]: (_from_signed64(row["simhash"]), row["title"]) for row in rows
+        }
 
     # Briefing operations
     async def save_briefing(self, briefing: Briefing) -> int:
@@ -362,16 +1159,32 @@ class Database:
         await self._connection.commit()
         return cursor.lastrowid or -1
 
-    async def get_briefing(self, date: str) -> Briefing | None:
-        """Get briefing by date."""
+    async def get_briefing(
+        self, date: str, briefing_type: str | None = None
+    ) -> Briefing | None:
+        """Get the latest briefing for a date.
+
+        Args:
+            date: Briefing date (ISO format)
+            briefing_type: Only return briefings of this type (any type if None)
+
+        Returns:
+            Most recently generated matching briefing, or None
+
+        """
         if not self._connection:
             return None
 
-        cursor = await self._connection.execute(
-            "SELECT * FROM briefings WHERE date = ? ORDER BY generated_at DESC LIMIT 1",
-            (date,),
+        query = "SELECT * FROM briefings WHERE date = ?"
+        params: tuple[Any, ...] = (date,)
+
+        if briefing_type is not None:
+            query += " AND type = ?"
+            params += (briefing_type,)
+
+        row = await self._fetchone(
+            query + " ORDER BY generated_at DESC LIMIT 1", params
         )
-        row = await cursor.fetchone()
 
         if not row:
             return None
@@ -427,7 +1240,7 @@ class Database:
         if not self._connection:
             return {}
 
-        cursor = await self._connection.execute(
+        row = await self._fetchone(
             """
             SELECT
                 COUNT(*) as total,
@@ -437,7 +1250,6 @@ class Database:
             FROM feedback
             """
         )
-        row = await cursor.fetchone()
 
         return {
             "total": row["total"] if row else 0,
@@ -452,10 +1264,15 @@ class Database:
         if not self._connection:
             return
 
+        cutoff = _to_epoch(datetime.now() - timedelta(days=days))
         await self._connection.execute(
-            "DELETE FROM articles WHERE fetched_at < datetime('now', '-' || ? || ' days')",
-            (days,),
+            "DELETE FROM articles WHERE fetched_at < ?", (cutoff,)
         )
+        if self._fts_available:
+            # Also drops index rows of articles deleted by other SQLite clients
+            await self._connection.execute(
+                "DELETE FROM articles_fts WHERE rowid NOT IN (SELECT seq FROM articles)"
+            )
         await self._connection.commit()
         _LOGGER.debug("Cleaned up articles older than %d days", days)
 
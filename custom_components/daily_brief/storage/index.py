@@ -0,0 +1,53 @@
+"""Local search indexing for Daily Brief articles."""
+from __future__ import annotations
+
+import re
+
+# CJK characters are tokens of their own, other scripts split on word boundaries
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_TOKEN_RE = re.compile(rf"[{_CJK}]|[^\W_{_CJK}]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens.
+
+    Each CJK character is a token of its own, since those scripts do not
+    separate words with spaces.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Tokens in text order
+
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def fts_text(text: str | None) -> str:
+    """Normalize text for the FTS5 index.
+
+    FTS5's own tokenizer treats a run of CJK characters as one word, so the
+    text is pre-split with :func:`tokenize` and joined with spaces.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Space-separated tokens
+
+    """
+    return " ".join(tokenize(text or ""))
+
+
+def fts_query(phrases: list[str]) -> str:
+    """Build an FTS5 query that matches any of several phrases.
+
+    Args:
+        phrases: Phrases such as interests or topics
+
+    Returns:
+        FTS5 MATCH expression, empty if no phrase has any token
+
+    """
+    return " OR ".join(f'"{tokens}"' for tokens in map(fts_text, phrases) if tokens)
@@ -1,10 +1,19 @@
 """Data models for Daily Brief storage."""
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches fall back to plain arrays
+    np = None
+
+_EPOCH = datetime(1970, 1, 1)
+
 
 @dataclass
 class UserConfig:
@@ -33,11 +42,19 @@ class ContentSource:
     weight: float = 1.0
     last_fetched: datetime | None = None
     error_count: int = 0
+    etag: str | None = None  # HTTP validators from the last successful fetch
+    last_modified: str | None = None
+    pack_id: str | None = None  # content pack, "custom" for config feeds
+    update_interval: float | None = None  # learned fetch interval in seconds
+    next_fetch: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
-    """Article model."""
+    """Article model.
+
+    Slotted, as thousands of articles are held at once during aggregation.
+    """
 
     id: str  # hash of URL
     source_id: int | None = None
@@ -51,6 +68,7 @@ class Article:
     language: str = "en"
     topics: list[str] = field(default_factory=list)
     score: float = 0.0
+    simhash: int = 0  # 64-bit near-duplicate fingerprint
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -70,6 +88,160 @@ class Article:
         }
 
 
+@dataclass(slots=True)
+class ArticleDigest:
+    """Lightweight view of an article for scoring and selection.
+
+    Carries everything selection looks at, but not the article body; the
+    body's size is summarized by ``content_length`` and ``word_count``.
+    """
+
+    id: str
+    source_id: int | None = None
+    title: str = ""
+    summary: str = ""
+    url: str = ""
+    author: str = ""
+    published_at: datetime | None = None
+    fetched_at: datetime | None = None
+    language: str = "en"
+    topics: list[str] = field(default_factory=list)
+    score: float = 0.0
+    content_length: int = 0  # characters in the article body
+    word_count: int = 0  # words in the body, or in the summary if there is none
+    relevance: float = 0.0  # full-text (bm25) match strength, 0 if not matched
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "source_id": self.source_id,
+            "title": self.title,
+            "summary": self.summary,
+            "url": self.url,
+            "author": self.author,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+            "language": self.language,
+            "topics": self.topics,
+            "score": self.score,
+        }
+
+
+class ArticleBatch:
+    """Columnar view of the numeric fields of many articles.
+
+    Every column is a flat ``array`` of doubles aligned with ``ids``, which
+    takes a fraction of the memory of the article objects and can be handed
+    to NumPy without copying. Timestamps are naive epoch seconds, NaN if
+    unknown; ``summary_word_length`` is the summary's average word length.
+    """
+
+    __slots__ = (
+        "ids",
+        "source_weight",
+        "published_at",
+        "fetched_at",
+        "content_length",
+        "word_count",
+        "summary_length",
+        "summary_word_length",
+        "topic_count",
+        "has_author",
+        "score",
+    )
+
+    COLUMNS = __slots__[1:]
+
+    def __init__(self, ids: list[str]) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            ids: Article IDs, one per row
+
+        """
+        self.ids = ids
+        zeros = array("d", bytes(8 * len(ids)))
+        self.source_weight = array("d", zeros)
+        self.published_at = array("d", zeros)
+        self.fetched_at = array("d", zeros)
+        self.content_length = array("d", zeros)
+        self.word_count = array("d", zeros)
+        self.summary_length = array("d", zeros)
+        self.summary_word_length = array("d", zeros)
+        self.topic_count = array("d", zeros)
+        self.has_author = array("d", zeros)
+        self.score = array("d", zeros)
+
+    @classmethod
+    def from_articles(cls, articles: Sequence[Article | ArticleDigest]) -> ArticleBatch:
+        """Build a batch from articles or digests.
+
+        The current article scores are taken as source weights, which is
+        what they hold between aggregation and scoring.
+
+        Args:
+            articles: Articles or article digests
+
+        Returns:
+            Batch with one row per article, in the same order
+
+        """
+        batch = cls([article.id for article in articles])
+
+        for row, article in enumerate(articles):
+            batch.source_weight[row] = article.score
+            batch.published_at[row] = _epoch_seconds(article.published_at)
+            batch.fetched_at[row] = _epoch_seconds(article.fetched_at)
+
+            if isinstance(article, ArticleDigest):
+                batch.content_length[row] = article.content_length
+                batch.word_count[row] = article.word_count
+            else:
+                batch.content_length[row] = len(article.content or "")
+                batch.word_count[row] = len((article.content or article.summary).split())
+
+            summary = article.summary or ""
+            summary_words = summary.split()
+            batch.summary_length[row] = len(summary)
+            batch.summary_word_length[row] = sum(len(w) for w in summary_words) / max(
+                1, len(summary_words)
+            )
+            batch.topic_count[row] = len(article.topics)
+            batch.has_author[row] = 1.0 if article.author else 0.0
+
+        return batch
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.ids)
+
+    def column(self, name: str) -> Any:
+        """Get a column as a NumPy array sharing the batch's memory.
+
+        Args:
+            name: Column name, one of COLUMNS
+
+        Returns:
+            Writable float64 ndarray view of the column
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+
+        """
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+
+        return np.frombuffer(getattr(self, name), dtype=np.float64)
+
+
+def _epoch_seconds(value: datetime | None) -> float:
+    """Convert a naive datetime to epoch seconds, NaN if unknown."""
+    if value is None:
+        return float("nan")
+    return (value - _EPOCH).total_seconds()
+
+
 @dataclass
 class Briefing:
     """Briefing model."""
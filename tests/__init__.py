@@ -0,0 +1 @@
+"""Tests for the Daily Brief integration."""
@@ -0,0 +1,237 @@
+"""Tests for database schema migrations."""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.daily_brief.const import DATABASE_NAME, STORAGE_DIR
+from custom_components.daily_brief.storage.database import Database
+from custom_components.daily_brief.storage.models import ContentSource
+
+# Schema of the first release, before any migration existed
+_BASELINE_SCHEMA = """
+CREATE TABLE config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL UNIQUE,
+    language TEXT DEFAULT 'en',
+    briefing_length TEXT DEFAULT 'balanced',
+    interests TEXT,
+    excluded_topics TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE sources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    type TEXT DEFAULT 'rss',
+    category TEXT,
+    language TEXT DEFAULT 'en',
+    enabled BOOLEAN DEFAULT 1,
+    weight REAL DEFAULT 1.0,
+    last_fetched TIMESTAMP,
+    error_count INTEGER DEFAULT 0
+);
+CREATE TABLE articles (
+    id TEXT PRIMARY KEY,
+    source_id INTEGER,
+    title TEXT NOT NULL,
+    summary TEXT,
+    content TEXT,
+    url TEXT NOT NULL,
+    author TEXT,
+    published_at TIMESTAMP,
+    fetched_at TIMESTAMP,
+    language TEXT,
+    topics TEXT,
+    score REAL DEFAULT 0,
+    FOREIGN KEY (source_id) REFERENCES sources(id)
+);
+CREATE TABLE briefings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date DATE NOT NULL,
+    type TEXT DEFAULT 'morning',
+    article_ids TEXT,
+    script TEXT,
+    audio_path TEXT,
+    duration INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'generating',
+    generated_at TIMESTAMP,
+    played_at TIMESTAMP,
+    play_count INTEGER DEFAULT 0
+);
+CREATE TABLE feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    briefing_id INTEGER,
+    article_id TEXT,
+    feedback_type TEXT,
+    listen_duration INTEGER DEFAULT 0,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (briefing_id) REFERENCES briefings(id)
+);
+CREATE TABLE user_profile (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL UNIQUE,
+    score REAL DEFAULT 0,
+    source TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX idx_articles_published ON articles(published_at DESC);
+CREATE INDEX idx_articles_score ON articles(score DESC);
+CREATE INDEX idx_briefings_date ON briefings(date DESC);
+CREATE INDEX idx_feedback_timestamp ON feedback(timestamp DESC);
+"""
+
+
+def _hass(config_dir: Path) -> SimpleNamespace:
+    (config_dir / STORAGE_DIR).mkdir(parents=True, exist_ok=True)
+    return SimpleNamespace(
+        config=SimpleNamespace(path=lambda *parts: str(config_dir.joinpath(*parts)))
+    )
+
+
+def _write_baseline(config_dir: Path, fetched_at: datetime) -> None:
+    """Create a database the way the first release stored its rows."""
+    (config_dir / STORAGE_DIR).mkdir(parents=True)
+    connection = sqlite3.connect(config_dir / STORAGE_DIR / DATABASE_NAME)
+    connection.executescript(_BASELINE_SCHEMA)
+    connection.execute(
+        "INSERT INTO sources (name, url, last_fetched) VALUES (?, ?, ?)",
+        ("Tech", "https://example.com/feed", "2026-10-15 06:00:00"),
+    )
+    connection.executemany(
+        """
+        INSERT INTO articles (id, source_id, title, summary, content, url, author,
+            published_at, fetched_at, language, topics, score)
+        VALUES (?, 1, ?, ?, ?, ?, '', ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                "a1",
+                "AI chips 人工智能",
+                "New accelerators ship",
+                "Body text of the chip story",
+                "https://example.com/1",
+                "2026-10-15 08:30:00",
+                fetched_at.isoformat(sep=" "),
+                "en",
+                json.dumps(["ai", "hardware"]),
+                0.5,
+            ),
+            (
+                "a2",
+                "Cup final",
+                "Match report",
+                "",
+                "https://example.com/2",
+                None,
+                fetched_at.isoformat(sep=" "),
+                "en",
+                json.dumps(["sports"]),
+                0.2,
+            ),
+        ],
+    )
+    connection.commit()
+    connection.close()
+
+
+def _schema(path: Path) -> dict[str, list[str]]:
+    """Get the columns of every table and the names of all indexes."""
+    connection = sqlite3.connect(path)
+    tables = [
+        row[0]
+        for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE 'articles_fts%'"
+        )
+    ]
+    schema = {
+        table: [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+        for table in tables
+    }
+    schema["indexes"] = sorted(
+        row[0]
+        for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        )
+    )
+    connection.close()
+    return schema
+
+
+@pytest.mark.asyncio
+async def test_baseline_database_migrates_to_latest(tmp_path: Path) -> None:
+    """Test a first-release database upgrades with its rows intact."""
+    fetched_at = (datetime.now() - timedelta(hours=1)).replace(microsecond=0)
+    _write_baseline(tmp_path, fetched_at)
+
+    database = Database(_hass(tmp_path))
+    await database.async_initialize()
+    try:
+        cursor = await database._connection.execute("PRAGMA user_version")
+        assert (await cursor.fetchone())[0] == len(database._migrations())
+
+        articles = {article.id: article for article in await database.get_articles()}
+        assert articles["a1"].topics == ["ai", "hardware"]
+        assert articles["a1"].published_at == datetime(2026, 10, 15, 8, 30)
+        assert articles["a1"].fetched_at == fetched_at
+        assert articles["a2"].published_at is None
+
+        (source,) = await database.get_or_create_sources(
+            [ContentSource(name="Tech", url="https://example.com/feed")]
+        )
+        assert source.last_fetched == datetime(2026, 10, 15, 6, 0)
+
+        assert database.fts_available
+        (digest,) = await database.get_candidate_digests(["人工智能"], excluded_topics=[])
+        assert digest.id == "a1"
+        assert digest.relevance > 0
+        assert digest.content_length == len("Body text of the chip story")
+
+        remaining = await database.get_candidate_digests([], excluded_topics=["sports"])
+        assert [digest.id for digest in remaining] == ["a1"]
+
+        assert set(await database.get_recent_fingerprints(1)) == {"a1", "a2"}
+    finally:
+        await database.async_close()
+
+
+@pytest.mark.asyncio
+async def test_migrated_schema_matches_new_database(tmp_path: Path) -> None:
+    """Test an upgraded database ends up with the schema of a fresh one."""
+    migrated_dir = tmp_path / "migrated"
+    fresh_dir = tmp_path / "fresh"
+    _write_baseline(migrated_dir, datetime.now())
+
+    for config_dir in (migrated_dir, fresh_dir):
+        database = Database(_hass(config_dir))
+        await database.async_initialize()
+        await database.async_close()
+
+    migrated = _schema(migrated_dir / STORAGE_DIR / DATABASE_NAME)
+    fresh = _schema(fresh_dir / STORAGE_DIR / DATABASE_NAME)
+
+    assert migrated == fresh
+    assert "idx_briefings_date" not in migrated["indexes"]
+
+
+@pytest.mark.asyncio
+async def test_reopening_keeps_version_and_rows(tmp_path: Path) -> None:
+    """Test migrations do not run again on an up-to-date database."""
+    _write_baseline(tmp_path, datetime.now())
+
+    for _ in range(2):
+        database = Database(_hass(tmp_path))
+        await database.async_initialize()
+        try:
+            cursor = await database._connection.execute("PRAGMA user_version")
+            assert (await cursor.fetchone())[0] == len(database._migrations())
+            assert len(await database.get_articles()) == 2
+        finally:
+            await database.async_close()
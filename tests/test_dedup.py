@@ -0,0 +1,173 @@
+"""Tests for article deduplication."""
+from __future__ import annotations
+
+import random
+
+from custom_components.daily_brief.feeds.dedup import (
+    Deduplicator,
+    SimHashIndex,
+    article_simhash,
+    hamming_distance,
+    simhash,
+)
+from custom_components.daily_brief.storage.models import Article
+
+_STORIES = [
+    "Apple unveils new iPhone with faster chip",
+    "Central bank raises interest rates by a quarter point",
+    "Storm forces thousands to evacuate coastal towns",
+    "Local team wins championship after dramatic overtime",
+    "Scientists discover new species of frog in the Amazon",
+    "Parliament passes budget after a long debate",
+    "Rocket maker delays fourth test flight of its launcher",
+    "人工智能芯片需求推动半导体股票上涨",
+]
+_EDITS = {"new": "latest", "a": "one", "after": "following", "of": "for", "the": "this"}
+
+
+def _prose(seed: int, words: int = 80) -> str:
+    """Build a body of varied text, long enough for a reliable SimHash."""
+    rng = random.Random(seed)
+    vocabulary = (
+        "oil demand supply prices traders said week market crude barrels output "
+        "analysts expect rise fall production exports refinery winter forecast"
+    ).split()
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _article(index: int, title: str, score: float = 0.0, summary: str = "") -> Article:
+    return Article(
+        id=f"a{index}",
+        title=title,
+        summary=summary,
+        url=f"https://example.com/{index}",
+        score=score,
+    )
+
+
+def _corpus(seed: int) -> list[Article]:
+    """Build stories with lightly edited copies and scores in random order."""
+    rng = random.Random(seed)
+    articles = []
+    for story in _STORIES:
+        for _ in range(rng.randint(1, 4)):
+            words = [
+                _EDITS.get(word, word) if rng.random() < 0.15 else word
+                for word in story.split()
+            ]
+            articles.append(" ".join(words))
+    rng.shuffle(articles)
+    return [
+        _article(index, title, score=rng.choice([1.0, 2.0, 3.0]))
+        for index, title in enumerate(articles)
+    ]
+
+
+def _brute_force(deduplicator: Deduplicator, articles: list[Article]) -> list[Article]:
+    """Deduplicate by comparing every article with every kept one."""
+    unique: list[Article] = []
+    for article in articles:
+        if any(kept.url == article.url for kept in unique):
+            continue
+        is_duplicate = False
+        for kept in list(unique):
+            if not deduplicator._are_similar(article, kept):
+                continue
+            if article.score > kept.score:
+                unique.remove(kept)
+            else:
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            unique.append(article)
+    return unique
+
+
+def test_deduplicate_matches_brute_force() -> None:
+    """Test the LSH index keeps the same articles as pairwise comparison."""
+    deduplicator = Deduplicator()
+
+    for seed in range(10):
+        articles = _corpus(seed)
+        expected = _brute_force(deduplicator, articles)
+
+        assert deduplicator.deduplicate(articles) == expected
+        assert len(expected) < len(articles)
+
+
+def test_deduplicate_keeps_highest_score_and_first_on_ties() -> None:
+    """Test duplicates resolve to the best score, then to the earliest article."""
+    articles = [
+        _article(0, "Storm forces thousands to evacuate coastal towns", score=1.0),
+        _article(1, "Storm forces thousands to evacuate coastal town", score=2.0),
+        _article(2, "Storm forces thousands to evacuate the coastal towns", score=2.0),
+        _article(3, "Local team wins championship after dramatic overtime"),
+    ]
+
+    assert [article.id for article in Deduplicator().deduplicate(articles)] == ["a1", "a3"]
+
+
+def test_merge_duplicates_groups_stories() -> None:
+    """Test every story collapses to one article."""
+    articles = _corpus(1)
+
+    merged = Deduplicator().merge_duplicates(articles)
+
+    assert len(merged) == len(_STORIES)
+
+
+def test_simhash_index_matches_brute_force() -> None:
+    """Test band lookups find exactly the fingerprints within the distance."""
+    rng = random.Random(5)
+    index = SimHashIndex(max_distance=6)
+    stored = {}
+    for key in range(500):
+        stored[key] = rng.getrandbits(64)
+        index.add(key, stored[key])
+    assert len(index) == 500
+
+    for _ in range(300):
+        base = stored[rng.randrange(500)]
+        fingerprint = base
+        for bit in rng.sample(range(64), rng.randint(0, 10)):
+            fingerprint ^= 1 << bit
+
+        match = index.find(fingerprint)
+        expected = {
+            key for key, value in stored.items() if hamming_distance(value, fingerprint) <= 6
+        }
+        if expected:
+            assert match in expected
+        else:
+            assert match is None
+
+
+def test_simhash_tolerates_small_edits() -> None:
+    """Test a one-word edit of a long text stays within the match distance."""
+    text = _prose(0)
+    edited = text.replace("oil", "gas", 1)
+
+    assert simhash("") == 0
+    assert hamming_distance(simhash(text), simhash(edited)) <= 6
+    assert hamming_distance(simhash(text), simhash(_prose(1))) > 6
+
+
+def test_filter_seen() -> None:
+    """Test stored IDs, near-duplicate bodies and short retitled stories are dropped."""
+    body = _prose(2)
+    stored = [
+        _article(0, "Oil prices fall", summary=body),
+        _article(1, "Apple unveils new iPhone with faster chip"),
+    ]
+    history = {article.id: (article_simhash(article), article.title) for article in stored}
+    fresh = [
+        _article(0, "Oil prices fall", summary=body),
+        _article(2, "Oil prices drop", summary=body.replace("oil", "gas", 1)),
+        _article(3, "Apple unveils new iPhone with quicker chip"),
+        _article(4, "Local team wins championship after dramatic overtime"),
+    ]
+    for article in fresh:
+        article.simhash = article_simhash(article)
+
+    assert [article.id for article in Deduplicator().filter_seen(fresh, history)] == ["a4"]
+    assert Deduplicator().filter_seen(fresh, {}) == fresh
@@ -0,0 +1,69 @@
+"""Tests for maximal marginal relevance reranking."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.daily_brief.components import diversity
+from custom_components.daily_brief.storage.models import ArticleDigest
+
+_WORDS = "chip market vote storm league vaccine rocket bank climate court".split()
+_TOPICS = ["tech", "politics", "sports", "health", "science", "finance"]
+
+
+def _articles(count: int, seed: int) -> list[ArticleDigest]:
+    rng = random.Random(seed)
+    return [
+        ArticleDigest(
+            id=f"a{index}",
+            title=" ".join(rng.choices(_WORDS, k=4)),
+            summary=" ".join(rng.choices(_WORDS, k=12)),
+            topics=rng.sample(_TOPICS, k=rng.randint(0, 2)),
+            score=rng.uniform(0, 100),
+        )
+        for index in range(count)
+    ]
+
+
+def _rerank_pairwise(monkeypatch: pytest.MonkeyPatch, *args, **kwargs):
+    with monkeypatch.context() as patch:
+        patch.setattr(diversity, "np", None)
+        return diversity.mmr_rerank(*args, **kwargs)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_matches_pairwise(monkeypatch: pytest.MonkeyPatch, seed: int) -> None:
+    """Test the NumPy picks equal the pure Python picks."""
+    articles = _articles(60, seed)
+    seed_ids = ["a3", "a3", "missing", "a10"]
+
+    vectorized = diversity.mmr_rerank(articles, 15, seed_ids=seed_ids)
+    pairwise = _rerank_pairwise(monkeypatch, articles, 15, seed_ids=seed_ids)
+
+    assert [article.id for article in vectorized] == [article.id for article in pairwise]
+    assert [article.id for article in vectorized[:2]] == ["a3", "a10"]
+
+
+def test_similar_articles_are_spread_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a near-copy of the top article is passed over for a distinct one."""
+    articles = [
+        ArticleDigest(id="top", title="rocket launch", summary="rocket launch today", score=100),
+        ArticleDigest(id="copy", title="rocket launch", summary="rocket launch today", score=99),
+        ArticleDigest(id="other", title="bank rates", summary="bank rates rise", score=80),
+    ]
+
+    for picks in (
+        diversity.mmr_rerank(articles, 2),
+        _rerank_pairwise(monkeypatch, articles, 2),
+    ):
+        assert [article.id for article in picks] == ["top", "other"]
+
+
+def test_count_bounds() -> None:
+    """Test the number of picks is limited by count and pool size."""
+    articles = _articles(5, 0)
+
+    assert diversity.mmr_rerank(articles, 0) == []
+    assert diversity.mmr_rerank([], 3) == []
+    assert len(diversity.mmr_rerank(articles, 10)) == 5
@@ -0,0 +1,29 @@
+"""Tests for the local search index helpers."""
+from __future__ import annotations
+
+from custom_components.daily_brief.storage.index import fts_query, fts_text, tokenize
+
+
+def test_tokenize_splits_words_and_cjk_characters() -> None:
+    """Test words split on boundaries and every CJK character is a token."""
+    assert tokenize("Machine-Learning, AI_chips!") == ["machine", "learning", "ai", "chips"]
+    assert tokenize("人工智能 news") == ["人", "工", "智", "能", "news"]
+    assert tokenize("") == []
+
+
+def test_fts_text_joins_tokens() -> None:
+    """Test text is normalized to space-separated tokens."""
+    assert fts_text("Apple's 新iPhone") == "apple s 新 iphone"
+    assert fts_text(None) == ""
+
+
+def test_fts_query_quotes_each_phrase() -> None:
+    """Test every phrase becomes a quoted FTS5 phrase joined with OR."""
+    assert fts_query(["machine learning", "AI"]) == '"machine learning" OR "ai"'
+    assert fts_query(["人工智能"]) == '"人 工 智 能"'
+
+
+def test_fts_query_drops_syntax_and_empty_phrases() -> None:
+    """Test FTS5 operators and quotes in user input cannot reach the query."""
+    assert fts_query(['"AND" NOT*', "", "!!!"]) == '"and not"'
+    assert fts_query([]) == ""
@@ -0,0 +1,71 @@
+"""Tests for the Aho-Corasick interest matcher."""
+from __future__ import annotations
+
+import random
+
+from custom_components.daily_brief.components.matcher import InterestMatcher
+from custom_components.daily_brief.storage.index import tokenize
+
+
+def _brute_force(interests: list[str], text: str) -> set[int]:
+    """Find interests by comparing token windows one interest at a time."""
+    tokens = tokenize(text)
+    found = set()
+    for index, interest in enumerate(interests):
+        pattern = tokenize(interest)
+        if not pattern:
+            continue
+        if any(
+            tokens[start : start + len(pattern)] == pattern
+            for start in range(len(tokens) - len(pattern) + 1)
+        ):
+            found.add(index)
+    return found
+
+
+def test_matches_respect_word_boundaries() -> None:
+    """Test a short interest does not match inside a longer word."""
+    matcher = InterestMatcher(["ai"])
+
+    assert matcher.find("The minister said so") == set()
+    assert matcher.find("New AI chips") == {0}
+
+
+def test_overlapping_and_duplicate_interests() -> None:
+    """Test overlapping interests and duplicate entries are all reported."""
+    matcher = InterestMatcher(["machine learning", "learning", "Learning", "deep"])
+
+    assert matcher.find("Advances in machine learning") == {0, 1, 2}
+    assert matcher.count("deep machine learning") == 4
+
+
+def test_cjk_interests_match_inside_text() -> None:
+    """Test CJK interests match without word separators."""
+    matcher = InterestMatcher(["人工智能", "芯片"])
+
+    assert matcher.find("新一代人工智能芯片发布") == {0, 1}
+    assert matcher.find("人工智慧") == set()
+
+
+def test_empty_matcher() -> None:
+    """Test a matcher without usable interests is falsy and finds nothing."""
+    matcher = InterestMatcher(["", "!!"])
+
+    assert not matcher
+    assert matcher.find("anything at all") == set()
+    assert InterestMatcher(["ai"])
+
+
+def test_matches_brute_force() -> None:
+    """Test the automaton finds the same interests as a token window scan."""
+    rng = random.Random(7)
+    vocabulary = ["a", "b", "c", "ab", "ba", "人", "工"]
+    interests = [
+        " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+        for _ in range(25)
+    ]
+    matcher = InterestMatcher(interests)
+
+    for _ in range(200):
+        text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12)))
+        assert matcher.find(text) == _brute_force(interests, text), text
@@ -0,0 +1,154 @@
+"""Tests for the streaming feed parser."""
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from custom_components.daily_brief.feeds.parser import (
+    FeedParser,
+    parse_feed_content,
+    parse_feed_records,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class _Body:
+    """Response body that arrives in small chunks."""
+
+    def __init__(self, data: bytes, chunk_size: int = 97) -> None:
+        self._data = data
+        self._chunk_size = chunk_size
+
+    async def iter_chunked(self, _size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._data), self._chunk_size):
+            yield self._data[start : start + self._chunk_size]
+
+
+class _Response:
+    """Just enough of an aiohttp response for _stream_records."""
+
+    def __init__(self, data: bytes) -> None:
+        self.content = _Body(data)
+
+
+def _article_id(url: str) -> str:
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+async def _stream(name: str, known_ids: set[str] | None = None):
+    data = (FIXTURES / name).read_bytes()
+    return await FeedParser()._stream_records(_Response(data), known_ids or set())
+
+
+@pytest.mark.asyncio
+async def test_rss_extensions_do_not_shadow_core_fields() -> None:
+    """Test media: and itunes: children never replace RSS fields."""
+    records, known_published, body = await _stream("rss_media_itunes.xml")
+
+    assert body == b""
+    assert known_published == []
+    first, second = records
+
+    assert first["title"] == "Chip makers race to ship AI accelerators"
+    assert first["link"] == "https://example.com/news/ai-accelerators"
+    assert "new accelerators" in first["summary"]
+    assert first["content"] == "<p>The full article body about accelerators.</p>"
+    assert first["author"] == "Jane Doe"
+    assert first["published"] == "Fri, 16 Oct 2026 08:30:00 +0200"
+    assert first["tags"] == ["Hardware"]
+
+    # An empty media:content must not count as the body
+    assert "content" not in second
+    assert "summary" not in second
+    assert second["link"] == "https://example.com/news/second"
+    assert second["updated"] == "2026-10-15T06:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_rss_records_become_articles() -> None:
+    """Test streamed RSS records parse into articles like feedparser entries."""
+    records, _, _ = await _stream("rss_media_itunes.xml")
+
+    first, second = parse_feed_records(records, source_id=7)
+
+    assert first.id == _article_id("https://example.com/news/ai-accelerators")
+    assert first.source_id == 7
+    assert first.summary == "Three vendors announced new accelerators this week."
+    assert first.content == "The full article body about accelerators."
+    assert first.published_at == datetime(2026, 10, 16, 6, 30)
+    assert first.topics == ["Hardware"]
+    assert first.simhash
+
+    assert second.title == "Second episode"
+    assert second.summary == ""
+    assert second.published_at == datetime(2026, 10, 15, 6, 0)
+
+
+@pytest.mark.asyncio
+async def test_atom_entries() -> None:
+    """Test Atom links, authors, dates and categories."""
+    records, _, _ = await _stream("atom.xml")
+
+    first, second = records
+    assert first["title"] == "Climate report warns of hotter summers"
+    assert first["link"] == "https://example.com/climate"
+    assert first["author"] == "John Roe"
+    assert first["published"] == "2026-10-16T07:00:00+02:00"
+    assert first["updated"] == "2026-10-16T09:00:00Z"
+    assert first["content"] == "<p>The full climate report coverage.</p>"
+    assert first["tags"] == ["Climate", "Science"]
+
+    assert second["link"] == "https://example.com/update"
+    assert "content" not in second
+
+    first_article, second_article = parse_feed_records(records)
+    assert first_article.published_at == datetime(2026, 10, 16, 5, 0)
+    assert first_article.content == "The full climate report coverage."
+    assert second_article.published_at == datetime(2026, 10, 14, 12, 0)
+    assert second_article.content == "Summary of the update."
+
+
+@pytest.mark.asyncio
+async def test_known_items_are_skipped_but_dated() -> None:
+    """Test known items yield no record but still report their publish time."""
+    known = {_article_id("https://example.com/news/ai-accelerators")}
+
+    records, known_published, _ = await _stream("rss_media_itunes.xml", known)
+
+    assert [record["link"] for record in records] == ["https://example.com/news/second"]
+    assert known_published == [datetime(2026, 10, 16, 6, 30)]
+
+
+@pytest.mark.asyncio
+async def test_unrecognized_feed_returns_body() -> None:
+    """Test a body without RSS or Atom items is handed back for feedparser."""
+    data = b'<?xml version="1.0"?><opml version="2.0"><body/></opml>'
+
+    records, known_published, body = await FeedParser()._stream_records(
+        _Response(data), set()
+    )
+
+    assert records is None
+    assert known_published == []
+    assert body == data
+
+
+def test_fallback_uses_http_charset() -> None:
+    """Test the feedparser fallback decodes with the Content-Type charset."""
+    data = (
+        "<rss version='2.0'><channel><item><title>Café crème</title>"
+        "<link>https://example.com/cafe</link></item></channel></rss>"
+    ).encode("iso-8859-1")
+
+    (article,) = parse_feed_content(
+        data,
+        "https://example.com/feed",
+        content_type="application/rss+xml; charset=iso-8859-1",
+    )
+
+    assert article.title == "Café crème"
@@ -0,0 +1,69 @@
+"""Tests for article scoring."""
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.daily_brief.components import selector
+from custom_components.daily_brief.components.selector import ArticleSelector
+from custom_components.daily_brief.storage.models import ArticleDigest
+
+_WORDS = "ai chips market election storm vaccine rocket bank climate robotics".split()
+
+
+def _articles(count: int, now: datetime) -> list[ArticleDigest]:
+    rng = random.Random(3)
+    articles = []
+    for index in range(count):
+        summary = " ".join(rng.choices(_WORDS, k=rng.randint(0, 30)))
+        articles.append(
+            ArticleDigest(
+                id=f"a{index}",
+                title=" ".join(rng.choices(_WORDS, k=5)),
+                summary=summary,
+                author=rng.choice(["", "Jane Doe"]),
+                published_at=rng.choice(
+                    [None, now - timedelta(minutes=rng.randint(0, 60 * 24 * 14))]
+                ),
+                topics=rng.sample(_WORDS, k=rng.randint(0, 2)),
+                score=rng.uniform(0.5, 2.0),
+                content_length=rng.choice([0, 800, 5000]),
+                word_count=rng.choice([0, 50, 150, 600, 900, 2500]),
+                relevance=rng.choice([0.0, rng.uniform(0.1, 12.0)]),
+            )
+        )
+    return articles
+
+
+@pytest.mark.parametrize("interests", [[], ["AI", "climate change", "robotics"]])
+def test_batch_scores_match_scalar_scores(interests: list[str]) -> None:
+    """Test NumPy batch scoring gives the per-article scores exactly."""
+    pytest.importorskip("numpy")
+    now = datetime(2026, 10, 16, 12, 0)
+    articles = _articles(200, now)
+    copies = [replace(article) for article in articles]
+    scorer = ArticleSelector(None)
+    top_relevance = max(article.relevance for article in articles)
+
+    expected = [
+        scorer._calculate_score(article, interests, now, top_relevance)
+        for article in articles
+    ]
+    scorer._score_batch(copies, interests, now, top_relevance)
+
+    assert [article.score for article in copies] == expected
+
+
+def test_iter_scored_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the lazy scalar path scores and yields every article in order."""
+    monkeypatch.setattr(selector, "np", None)
+    articles = _articles(20, datetime.now())
+    scorer = ArticleSelector(None)
+
+    scored = list(scorer._iter_scored(articles, ["ai"]))
+
+    assert scored == articles
+    assert all(0 <= article.score <= 100 for article in scored)